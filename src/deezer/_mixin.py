@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import json
+import logging
+from collections.abc import Callable, Collection, Iterable
 from typing import Any, ClassVar
+from weakref import WeakValueDictionary
 
-from deezer.exceptions import DeezerUnknownResource
+import httpx
+
+from deezer.cache import BaseCache
+from deezer.events import RequestEvent
+from deezer.exceptions import DATA_NOT_FOUND_ERROR_CODE, DeezerErrorResponse, DeezerUnknownResource
 from deezer.resources import (
     Album,
     Artist,
@@ -17,6 +25,12 @@ from deezer.resources import (
     Track,
     User,
 )
+from deezer.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Fields describing the relation to the resource listing it, rather than the resource itself
+RELATION_FIELDS = frozenset({"role", "time_add", "position"})
 
 
 class DeezerMixin:
@@ -24,6 +38,16 @@ class DeezerMixin:
 
     _resource_base_class: ClassVar[type[Resource]] = Resource
 
+    cache: BaseCache | None = None
+    retry: Retry | None = None
+    page_size: int | None = None
+    lazy_parsing: bool = False
+    json_loads: Callable[[bytes], Any] = staticmethod(json.loads)
+    # Set per instance by the clients
+    observers: list[Callable[[RequestEvent], None]]
+    _identity_map: WeakValueDictionary[tuple[str, int], Any] | None = None
+    _token_digest: str | None = None
+
     objects_types: ClassVar[dict[str, type[Resource] | None]] = {
         "album": Album,
         "artist": Artist,
@@ -39,6 +63,121 @@ class DeezerMixin:
         "user": User,
     }
 
+    def _get_request_key(self, method: str, path: str, params: Any = None) -> str | None:
+        """
+        Build a key identifying a request, to cache or share its response.
+
+        The access token is only added to the request when it's sent, so
+        a digest of it is part of the key: the responses for a user are
+        never served to a client authenticated as another user.
+
+        :returns: the key, or ``None`` for requests other than ``GET``.
+        """
+        if method.upper() != "GET":
+            return None
+        query_params = httpx.QueryParams(params)
+        query = httpx.QueryParams(sorted(query_params.multi_items()))
+        request_key = f"GET {path}?{query}" if query else f"GET {path}"
+        if self._token_digest is not None:
+            request_key = f"{request_key} token:{self._token_digest}"
+        return request_key
+
+    def _get_cached(self, request_key: str | None) -> bytes | None:
+        """Get the content of a cached response, if any."""
+        if request_key is None or self.cache is None:
+            return None
+        return self.cache.get(request_key)
+
+    def _set_cached(self, request_key: str | None, path: str, content: bytes) -> None:
+        """Store the content of a successful response in the cache."""
+        if request_key is None or self.cache is None:
+            return
+        self.cache.set(request_key, content, self._get_endpoint(path))
+
+    def _evict_cached(self, path: str) -> None:
+        """
+        Remove from the cache the responses about a resource changed by a request.
+
+        The responses for the resource at the start of the path, like
+        ``playlist/1`` for ``playlist/1/tracks``, and its relations are removed.
+        """
+        if self.cache is None:
+            return
+        self.cache.delete("/".join(path.strip("/").split("/")[:2]))
+
+    def _set_not_found(self, path: str) -> None:
+        """
+        Store in the cache that there's no resource at the given path.
+
+        The content stored is a JSON ``null``, which the client returns as
+        ``None`` when the response is read from the cache.
+        """
+        self._set_cached(self._get_request_key("GET", path), path, b"null")
+
+    @staticmethod
+    def _is_not_found(exc: Exception) -> bool:
+        """Whether the exception is the error returned by the API when there's no data."""
+        if not isinstance(exc, DeezerErrorResponse):
+            return False
+        error = exc.json_data.get("error")
+        return isinstance(error, dict) and error.get("code") == DATA_NOT_FOUND_ERROR_CODE
+
+    @staticmethod
+    def _get_endpoint(path: str) -> str:
+        """Get the endpoint from a path, e.g. 'artist' for 'artist/27/top'."""
+        return path.lstrip("/").split("/", 1)[0]
+
+    def _notify_observers(self, event: RequestEvent) -> None:
+        """
+        Send the details of a request to the observers.
+
+        An observer failing doesn't affect the request, nor the other
+        observers: the exception is logged and otherwise ignored.
+        """
+        for observer in self.observers:
+            try:
+                observer(event)
+            except Exception:
+                logger.exception("Observer %r failed on %r", observer, event)
+
+    def _raise_for_error(self, json_data: Any) -> None:
+        """Raise the appropriate exception if the API returned an error payload."""
+        if isinstance(json_data, dict) and json_data.get("error"):
+            raise DeezerErrorResponse.from_json(json_data)
+
+    def _get_retry_delay(self, method: str, exc: Exception, attempt: int) -> float | None:
+        """
+        Get the delay before retrying a failed request.
+
+        :returns: the delay in seconds, or ``None`` if it shouldn't be retried.
+        """
+        if self.retry is None:
+            return None
+        return self.retry.get_delay(method, exc, attempt)
+
+    @staticmethod
+    def _group_resources_to_hydrate(
+        resources: Iterable[Any],
+        fields: Collection[str] | None = None,
+    ) -> dict[tuple[str, int], list[Any]]:
+        """
+        Group the resources to fetch by type and ID, to fetch each one once.
+
+        :param fields: the fields needed, to skip the resources having all of
+                       them. By default, all the resources are fetched.
+        """
+        groups: dict[tuple[str, int], list[Any]] = {}
+        for resource in resources:
+            if fields is not None and all(field_name in resource._fields for field_name in fields):
+                continue
+            groups.setdefault((resource.type, resource.id), []).append(resource)
+        return groups
+
+    @staticmethod
+    def _is_nested_json(value: Any) -> bool:
+        """Whether a value in a response is a nested resource, or list of resources."""
+        return isinstance(value, dict) and ("type" in value or "data" in value)
+
     def _process_json(
         self,
         item: dict[str, Any],
@@ -66,7 +205,7 @@ class DeezerMixin:
 
         result = {}
         for key, value in item.items():
-            if isinstance(value, dict) and ("type" in value or "data" in value):
+            if not self.lazy_parsing and self._is_nested_json(value):
                 value = self._process_json(value, parent)
             result[key] = value
         if parent is not None:
@@ -87,4 +226,34 @@ class DeezerMixin:
         else:
             raise DeezerUnknownResource(f"Unable to find resource type for {result!r}")
         assert object_class is not None  # noqa S101
-        return object_class(self, result)
+        resource = self._build_resource(object_class, result)
+        if parent is not None and resource._raw:
+            # Forwarded to the nested resources, once converted
+            resource._parent = parent
+        return resource
+
+    def _build_resource(self, object_class: type[Any], fields: dict[str, Any]):
+        """
+        Build a resource from its fields, or reuse the one already built.
+
+        When the identity map is enabled, the resource having the same
+        type and ID as another one still in use is the same object. It's
+        updated with the fields of the new response. Resources with fields
+        specific to their occurrence, like the role of a contributor, are
+        never shared.
+        """
+        if (
+            self._identity_map is None
+            or not isinstance(fields.get("type"), str)
+            or "id" not in fields
+            or not RELATION_FIELDS.isdisjoint(fields)
+        ):
+            return object_class(self, fields)
+        key = (fields["type"], fields["id"])
+        resource = self._identity_map.get(key)
+        if resource is not None and type(resource) is object_class:
+            resource._merge_fields(fields)
+            return resource
+        resource = object_class(self, fields)
+        self._identity_map[key] = resource
+        return resource
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-from typing import ClassVar
+import asyncio
+import functools
+import json
+import time
+from collections.abc import Callable, Collection, Iterable
+from typing import Any, ClassVar
+from weakref import WeakValueDictionary
 
 import httpx
 from httpx._types import HeaderTypes
 
 from deezer._mixin import DeezerMixin
-from deezer.auth import DeezerQueryAuth
-from deezer.exceptions import (
-    DeezerErrorResponse,
-    DeezerHTTPError,
-)
+from deezer.auth import DeezerQueryAuth, get_token_digest
+from deezer.cache import BaseCache
+from deezer.events import RequestEvent
+from deezer.exceptions import DeezerAPIException, DeezerErrorResponse, DeezerHTTPError
+from deezer.ratelimit import RateLimiter
 from deezer.resources import Resource
+from deezer.retry import Retry
 
 from .pagination import AsyncPaginatedList
 from .resources import (
@@ -51,6 +58,27 @@ class AsyncClient(DeezerMixin, httpx.AsyncClient):
 
     :param access_token: user access token.
     :param headers: a dictionary of headers to be used.
+    :param cache: an optional :class:`~deezer.cache.BaseCache` to store the
+                  responses of ``GET`` requests.
+    :param rate_limiter: an optional :class:`~deezer.ratelimit.RateLimiter`
+                         to pace the requests sent to the API.
+    :param retry: an optional :class:`~deezer.retry.Retry` policy for
+                  the requests failing with a temporary error.
+    :param page_size: the default number of elements to fetch per request
+                      for the paginated lists, instead of the API default.
+    :param lazy_parsing: whether to defer the parsing of the fields needing
+                         conversion, like dates and nested resources, until
+                         they're first accessed.
+    :param identity_map: whether the resources with the same type and ID
+                         should be the same object, as long as it's in use.
+    :param json_loads: the function decoding the JSON content of the responses,
+                       from bytes. Defaults to :func:`json.loads`, a faster
+                       decoder like ``orjson.loads`` may be given instead.
+    :param observers: functions called with a :class:`~deezer.events.RequestEvent`
+                      after each request, to monitor them. More may be added
+                      later to the ``observers`` list.
+    :param coalesce_requests: whether identical ``GET`` requests made
+                              concurrently should share a single API call.
     """
 
     _resource_base_class: ClassVar[type[AsyncResource]] = AsyncResource
@@ -73,9 +101,29 @@ class AsyncClient(DeezerMixin, httpx.AsyncClient):
         self,
         access_token: str | None = None,
         headers: HeaderTypes | None = None,
+        cache: BaseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: Retry | None = None,
+        page_size: int | None = None,
+        lazy_parsing: bool = False,
+        identity_map: bool = False,
+        json_loads: Callable[[bytes], Any] | None = None,
+        observers: Iterable[Callable[[RequestEvent], None]] | None = None,
+        coalesce_requests: bool = False,
     ):
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.page_size = page_size
+        self.lazy_parsing = lazy_parsing
+        self._identity_map = WeakValueDictionary() if identity_map else None
+        self.json_loads = json_loads or json.loads
+        self.observers = list(observers or ())
+        self.coalesce_requests = coalesce_requests
+        self._in_flight: dict[str, asyncio.Future] = {}
         if access_token:
             deezer_auth = DeezerQueryAuth(access_token=access_token)
+            self._token_digest = get_token_digest(access_token)
         else:
             deezer_auth = None
         super().__init__(
@@ -92,6 +140,7 @@ class AsyncClient(DeezerMixin, httpx.AsyncClient):
         resource_type: type[AsyncResource] | type[Resource] | None = None,
         resource_id: int | None = None,
         paginate_list=False,
+        use_cache: bool = True,
         **kwargs,
     ):
         """
@@ -103,31 +152,254 @@ class AsyncClient(DeezerMixin, httpx.AsyncClient):
         :param resource_type: The resource class to use as top level.
         :param resource_id: The resource id to use as top level.
         :param paginate_list: Whether to wrap list into a pagination object.
+        :param use_cache: Whether a cached response may be used. The response
+                          received is cached either way.
         """
-        response = await super().request(
-            method,
-            path,
-            **kwargs,
-        )
+        event = RequestEvent(method, path)
+        try:
+            return await self._request(
+                method,
+                path,
+                event,
+                parent,
+                resource_type,
+                resource_id,
+                paginate_list,
+                use_cache,
+                **kwargs,
+            )
+        except Exception as exc:
+            event.error = exc
+            raise
+        finally:
+            self._notify_observers(event)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        event: RequestEvent,
+        parent: AsyncResource | Resource | None,
+        resource_type: type[AsyncResource] | type[Resource] | None,
+        resource_id: int | None,
+        paginate_list: bool,
+        use_cache: bool,
+        **kwargs,
+    ):
+        """Make a request to the API and parse the response, recording the details in the event."""
+        request_key = self._get_request_key(method, path, kwargs.get("params"))
+        content = self._get_cached(request_key) if use_cache else None
+        if content is not None:
+            event.cache_hit = True
+            event.response_size = len(content)
+            start = time.perf_counter()
+            json_data = self.json_loads(content)
+        elif request_key is not None and self.coalesce_requests:
+            json_data = await self._request_coalesced(method, path, request_key, event, **kwargs)
+            start = time.perf_counter()
+        else:
+            _, json_data = await self._request_with_retry(method, path, request_key, event, **kwargs)
+            start = time.perf_counter()
+        try:
+            if not isinstance(json_data, dict):
+                return json_data
+            return self._process_json(
+                json_data,
+                parent=parent,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                paginate_list=paginate_list,
+            )
+        finally:
+            event.parse_time += time.perf_counter() - start
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        path: str,
+        request_key: str | None,
+        event: RequestEvent,
+        **kwargs,
+    ):
+        """Send a request to the API, retrying it according to the retry policy."""
+        attempt = 0
+        while True:
+            try:
+                return await self._request_once(method, path, request_key, event, **kwargs)
+            except (httpx.TransportError, DeezerAPIException) as exc:
+                delay = self._get_retry_delay(method, exc, attempt)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+            event.retries = attempt
+
+    async def _request_coalesced(self, method: str, path: str, request_key: str, event: RequestEvent, **kwargs):
+        """
+        Share the response of identical ``GET`` requests in flight.
+
+        The first caller starts the request in a task of its own, and all
+        the callers wait for its response, so cancelling one of them doesn't
+        affect the others. If the shared request itself is cancelled, the
+        callers still waiting send it again, one of them sharing it with the
+        others. Each caller decodes the response content on its own, to get
+        its own resources tree. For the callers waiting, the time waited is
+        recorded as network time.
+        """
+        task = self._in_flight.get(request_key)
+        request_event = None
+        if task is None:
+            request_event = RequestEvent(method, path)
+            task = asyncio.ensure_future(self._request_with_retry(method, path, request_key, request_event, **kwargs))
+            self._in_flight[request_key] = task
+            task.add_done_callback(functools.partial(self._request_done, request_key))
+        start = time.perf_counter()
+        try:
+            content, json_data = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise
+            # The shared request was cancelled, rather than this caller
+            if self._in_flight.get(request_key) is task:
+                del self._in_flight[request_key]
+            return await self._request_coalesced(method, path, request_key, event, **kwargs)
+        finally:
+            if request_event is not None and task.done() and not task.cancelled():
+                event.status_code = request_event.status_code
+                event.response_size = request_event.response_size
+                event.retries = request_event.retries
+                event.network_time += request_event.network_time
+                event.parse_time += request_event.parse_time
+        if request_event is not None:
+            return json_data
+        event.network_time += time.perf_counter() - start
+        event.response_size = len(content)
+        start = time.perf_counter()
+        json_data = self.json_loads(content)
+        event.parse_time += time.perf_counter() - start
+        return json_data
+
+    def _request_done(self, request_key: str, task: asyncio.Future) -> None:
+        """Forget about a request once it's completed."""
+        if self._in_flight.get(request_key) is task:
+            del self._in_flight[request_key]
+        if not task.cancelled():
+            # Mark the exception as retrieved, even if no caller is left
+            task.exception()
+
+    async def _request_once(
+        self,
+        method: str,
+        path: str,
+        request_key: str | None,
+        event: RequestEvent,
+        **kwargs,
+    ):
+        """
+        Send a single request to the API and decode the response.
+
+        :returns: a tuple with the raw content and the decoded response.
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.async_acquire()
+        start = time.perf_counter()
+        try:
+            response = await super().request(
+                method,
+                path,
+                **kwargs,
+            )
+        finally:
+            event.network_time += time.perf_counter() - start
+        event.status_code = response.status_code
+        event.response_size = len(response.content)
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
             raise DeezerHTTPError.from_http_error(exc) from exc
-        json_data = response.json()
-        if not isinstance(json_data, dict):
-            return json_data
-        if json_data.get("error"):
-            raise DeezerErrorResponse(json_data)
-        return self._process_json(
-            json_data,
-            parent=parent,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            paginate_list=paginate_list,
+        start = time.perf_counter()
+        json_data = self.json_loads(response.content)
+        event.parse_time += time.perf_counter() - start
+        self._raise_for_error(json_data)
+        if method.upper() == "GET":
+            self._set_cached(request_key, path, response.content)
+        else:
+            self._evict_cached(path)
+        return response.content, json_data
+
+    async def _get_paginated_list(self, path: str, params: dict | None = None, page_size: int | None = None):
+        return await AsyncPaginatedList.create(client=self, base_path=path, params=params, page_size=page_size)
+
+    async def hydrate(
+        self,
+        resources: Iterable[AsyncResource],
+        fields: Collection[str] | None = None,
+        max_concurrency: int = 4,
+    ) -> list[AsyncResource]:
+        """
+        Fetch the full version of the given resources, and complete them in place.
+
+        The resources are fetched concurrently, and the ones with the same
+        type and ID are fetched once.
+
+        :param resources: the resources to complete.
+        :param fields: the fields needed, to only fetch the resources missing
+                       some of them. By default, all the resources are fetched.
+        :param max_concurrency: the maximum number of resources fetched at once.
+        :returns: the given resources, as a list. The ones which couldn't be
+                  fetched are left partial.
+        """
+        resources = list(resources)
+        groups = self._group_resources_to_hydrate(resources, fields)
+        full_resources = await self._get_many(
+            (f"{resource_type}/{resource_id}" for resource_type, resource_id in groups),
+            max_concurrency=max_concurrency,
         )
+        for group, full_resource in zip(groups.values(), full_resources, strict=True):
+            if isinstance(full_resource, Exception):
+                continue
+            for resource in group:
+                resource._update_from(full_resource)
+        return resources
+
+    async def _get_many(self, paths: Iterable[str], max_concurrency: int, resolve: bool = False) -> list:
+        """
+        Get the resources at the given paths concurrently, in the same order.
+
+        Each path is requested once. The resources which couldn't be fetched
+        are replaced by the exception raised.
+
+        :param resolve: whether the resources not found are ``None``,
+                        see :meth:`_resolve`, rather than an exception.
+        """
+        paths = list(paths)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get_resource(path: str):
+            async with semaphore:
+                try:
+                    return await (self._resolve(path) if resolve else self.request("GET", path))
+                except (httpx.TransportError, DeezerAPIException) as exc:
+                    return exc
+
+        unique_paths = list(dict.fromkeys(paths))
+        results = dict(zip(unique_paths, await asyncio.gather(*map(get_resource, unique_paths)), strict=True))
+        return [results[path] for path in paths]
+
+    async def _resolve(self, path: str):
+        """
+        Get the resource at the given path, or ``None`` if there's none.
 
-    async def _get_paginated_list(self, path: str, params: dict | None = None):
-        return await AsyncPaginatedList.create(client=self, base_path=path, params=params)
+        With a cache, the resources not found are cached as well, to
+        avoid asking again for them.
+        """
+        try:
+            return await self.request("GET", path)
+        except DeezerErrorResponse as exc:
+            if not self._is_not_found(exc):
+                raise
+        self._set_not_found(path)
+        return None
 
     async def get_artist(self, artist_id: int) -> AsyncArtist:
         """
@@ -153,6 +425,100 @@ class AsyncClient(DeezerMixin, httpx.AsyncClient):
         """
         return await self.request("GET", f"track/{track_id}")
 
+    async def get_artists(self, artist_ids: Iterable[int], max_concurrency: int = 4) -> list[AsyncArtist | Exception]:
+        """
+        Get the artists with the given IDs, concurrently.
+
+        See :meth:`get_albums` for details.
+
+        :param artist_ids: the IDs of the artists.
+        :param max_concurrency: the maximum number of artists fetched at once.
+        :returns: a list of :class:`~deezer.asyncio.AsyncArtist` objects, or exceptions.
+        """
+        return await self._get_many((f"artist/{artist_id}" for artist_id in artist_ids), max_concurrency)
+
+    async def get_albums(self, album_ids: Iterable[int], max_concurrency: int = 4) -> list[AsyncAlbum | Exception]:
+        """
+        Get the albums with the given IDs, concurrently.
+
+        The albums are in the same order as the IDs. An album which couldn't
+        be fetched, for instance because it doesn't exist, is replaced by the
+        exception raised, without failing the other ones.
+
+        :param album_ids: the IDs of the albums.
+        :param max_concurrency: the maximum number of albums fetched at once.
+        :returns: a list of :class:`~deezer.asyncio.AsyncAlbum` objects, or exceptions.
+        """
+        return await self._get_many((f"album/{album_id}" for album_id in album_ids), max_concurrency)
+
+    async def get_album_by_upc(self, upc: str) -> AsyncAlbum | None:
+        """
+        Get the album with the given UPC (Universal Product Code).
+
+        :returns: an :class:`~deezer.asyncio.AsyncAlbum` object, or ``None``
+                  if there's no album with this UPC.
+        """
+        return await self._resolve(f"album/upc:{upc.strip()}")
+
+    async def get_albums_by_upc(
+        self,
+        upcs: Iterable[str],
+        max_concurrency: int = 4,
+    ) -> list[AsyncAlbum | Exception | None]:
+        """
+        Get the albums with the given UPCs, concurrently.
+
+        The albums are in the same order as the UPCs, with ``None`` for the
+        UPCs without album. See :meth:`get_albums` for details.
+
+        :param upcs: the UPCs of the albums.
+        :param max_concurrency: the maximum number of albums fetched at once.
+        :returns: a list of :class:`~deezer.asyncio.AsyncAlbum` objects, ``None`` or exceptions.
+        """
+        return await self._get_many((f"album/upc:{upc.strip()}" for upc in upcs), max_concurrency, resolve=True)
+
+    async def get_track_by_isrc(self, isrc: str) -> AsyncTrack | None:
+        """
+        Get the track with the given ISRC (International Standard Recording Code).
+
+        :returns: an :class:`~deezer.asyncio.AsyncTrack` object, or ``None``
+                  if there's no track with this ISRC.
+        """
+        return await self._resolve(f"track/isrc:{isrc.strip().upper()}")
+
+    async def get_tracks_by_isrc(
+        self,
+        isrcs: Iterable[str],
+        max_concurrency: int = 4,
+    ) -> list[AsyncTrack | Exception | None]:
+        """
+        Get the tracks with the given ISRCs, concurrently.
+
+        The tracks are in the same order as the ISRCs, with ``None`` for the
+        ISRCs without track. See :meth:`get_albums` for details.
+
+        :param isrcs: the ISRCs of the tracks.
+        :param max_concurrency: the maximum number of tracks fetched at once.
+        :returns: a list of :class:`~deezer.asyncio.AsyncTrack` objects, ``None`` or exceptions.
+        """
+        return await self._get_many(
+            (f"track/isrc:{isrc.strip().upper()}" for isrc in isrcs),
+            max_concurrency,
+            resolve=True,
+        )
+
+    async def get_tracks(self, track_ids: Iterable[int], max_concurrency: int = 4) -> list[AsyncTrack | Exception]:
+        """
+        Get the tracks with the given IDs, concurrently.
+
+        See :meth:`get_albums` for details.
+
+        :param track_ids: the IDs of the tracks.
+        :param max_concurrency: the maximum number of tracks fetched at once.
+        :returns: a list of :class:`~deezer.asyncio.AsyncTrack` objects, or exceptions.
+        """
+        return await self._get_many((f"track/{track_id}" for track_id in track_ids), max_concurrency)
+
     async def get_genre(self, genre_id: int) -> AsyncGenre:
         """
         Get the genre with the given ID.
@@ -218,13 +584,14 @@ class AsyncClient(DeezerMixin, httpx.AsyncClient):
         """
         return await self.request("GET", f"chart/{genre_id}", resource_type=AsyncChart, resource_id=genre_id)
 
-    async def list_editorials(self) -> AsyncPaginatedList:
+    async def list_editorials(self, page_size: int | None = None) -> AsyncPaginatedList:
         """
         List editorials.
 
+        :param page_size: the number of elements to fetch per request.
         :returns: an :class:`AsyncPaginatedList` of :class:`AsyncEditorial` objects.
         """
-        return await self._get_paginated_list("editorial")
+        return await self._get_paginated_list("editorial", page_size=page_size)
 
     async def list_genres(self) -> list[AsyncGenre]:
         """
@@ -242,13 +609,14 @@ class AsyncClient(DeezerMixin, httpx.AsyncClient):
         """
         return await self.request("GET", "radio")
 
-    async def get_radios_top(self) -> AsyncPaginatedList:
+    async def get_radios_top(self, page_size: int | None = None) -> AsyncPaginatedList:
         """
         Get the top radios.
 
+        :param page_size: the number of elements to fetch per request.
         :returns: an :class:`AsyncPaginatedList` of :class:`AsyncRadio` objects.
         """
-        return await self._get_paginated_list("radio/top")
+        return await self._get_paginated_list("radio/top", page_size=page_size)
 
     async def get_user_recommended_tracks(self, **kwargs) -> AsyncPaginatedList:
         """Get user's recommended tracks."""
@@ -270,10 +638,10 @@ class AsyncClient(DeezerMixin, httpx.AsyncClient):
         """Get user's flow."""
         return await AsyncPaginatedList.create(client=self, base_path="user/me/flow", **kwargs)
 
-    async def get_user_albums(self, user_id: int | None = None) -> AsyncPaginatedList:
+    async def get_user_albums(self, user_id: int | None = None, page_size: int | None = None) -> AsyncPaginatedList:
         """Get the favourites albums for the given user_id or current user."""
         user_id_str = str(user_id) if user_id else "me"
-        return await self._get_paginated_list(f"user/{user_id_str}/albums")
+        return await self._get_paginated_list(f"user/{user_id_str}/albums", page_size=page_size)
 
     async def add_user_album(self, album_id: int) -> bool:
         """Add an album to the user's library."""
@@ -283,10 +651,10 @@ class AsyncClient(DeezerMixin, httpx.AsyncClient):
         """Remove an album from the user's library."""
         return await self.request("DELETE", "user/me/albums", params={"album_id": album_id})
 
-    async def get_user_artists(self, user_id: int | None = None) -> AsyncPaginatedList:
+    async def get_user_artists(self, user_id: int | None = None, page_size: int | None = None) -> AsyncPaginatedList:
         """Get the favourites artists for the given user_id or current user."""
         user_id_str = str(user_id) if user_id else "me"
-        return await self._get_paginated_list(f"user/{user_id_str}/artists")
+        return await self._get_paginated_list(f"user/{user_id_str}/artists", page_size=page_size)
 
     async def add_user_artist(self, artist_id: int) -> bool:
         """Add an artist to the user's library."""
@@ -296,15 +664,15 @@ class AsyncClient(DeezerMixin, httpx.AsyncClient):
         """Remove an artist from the user's library."""
         return await self.request("DELETE", "user/me/artists", params={"artist_id": artist_id})
 
-    async def get_user_followers(self, user_id: int | None = None) -> AsyncPaginatedList:
+    async def get_user_followers(self, user_id: int | None = None, page_size: int | None = None) -> AsyncPaginatedList:
         """Get the followers for the given user_id or current user."""
         user_id_str = str(user_id) if user_id else "me"
-        return await self._get_paginated_list(f"user/{user_id_str}/followers")
+        return await self._get_paginated_list(f"user/{user_id_str}/followers", page_size=page_size)
 
-    async def get_user_followings(self, user_id: int | None = None) -> AsyncPaginatedList:
+    async def get_user_followings(self, user_id: int | None = None, page_size: int | None = None) -> AsyncPaginatedList:
         """Get the followings for the given user_id or current user."""
         user_id_str = str(user_id) if user_id else "me"
-        return await self._get_paginated_list(f"user/{user_id_str}/followings")
+        return await self._get_paginated_list(f"user/{user_id_str}/followings", page_size=page_size)
 
     async def add_user_following(self, user_id: int) -> bool:
         """Follow the given user ID as the currently authenticated user."""
@@ -314,14 +682,14 @@ class AsyncClient(DeezerMixin, httpx.AsyncClient):
         """Stop following the given user ID as the currently authenticated user."""
         return await self.request("DELETE", "user/me/followings", params={"user_id": user_id})
 
-    async def get_user_history(self) -> AsyncPaginatedList:
+    async def get_user_history(self, page_size: int | None = None) -> AsyncPaginatedList:
         """Get the recently played tracks for the current user."""
-        return await self._get_paginated_list("user/me/history")
+        return await self._get_paginated_list("user/me/history", page_size=page_size)
 
-    async def get_user_tracks(self, user_id: int | None = None) -> AsyncPaginatedList:
+    async def get_user_tracks(self, user_id: int | None = None, page_size: int | None = None) -> AsyncPaginatedList:
         """Get the favourites tracks for the given user_id or current user."""
         user_id_str = str(user_id) if user_id else "me"
-        return await self._get_paginated_list(f"user/{user_id_str}/tracks")
+        return await self._get_paginated_list(f"user/{user_id_str}/tracks", page_size=page_size)
 
     async def add_user_track(self, track_id: int) -> bool:
         """Add a track to the user's library."""
@@ -358,6 +726,7 @@ class AsyncClient(DeezerMixin, httpx.AsyncClient):
         query: str = "",
         strict: bool | None = None,
         ordering: str | None = None,
+        page_size: int | None = None,
         **advanced_params: str | int | None,
     ):
         optional_params = {}
@@ -378,6 +747,7 @@ class AsyncClient(DeezerMixin, httpx.AsyncClient):
                 "q": " ".join(query_parts),
                 **optional_params,
             },
+            page_size=page_size,
         )
 
     async def search(
@@ -393,6 +763,7 @@ class AsyncClient(DeezerMixin, httpx.AsyncClient):
         dur_max: int | None = None,
         bpm_min: int | None = None,
         bpm_max: int | None = None,
+        page_size: int | None = None,
     ) -> AsyncPaginatedList:
         """
         Search tracks.
@@ -413,6 +784,7 @@ class AsyncClient(DeezerMixin, httpx.AsyncClient):
             dur_max=dur_max,
             bpm_min=bpm_min,
             bpm_max=bpm_max,
+            page_size=page_size,
         )
 
     async def search_albums(
@@ -420,24 +792,27 @@ class AsyncClient(DeezerMixin, httpx.AsyncClient):
         query: str = "",
         strict: bool | None = None,
         ordering: str | None = None,
+        page_size: int | None = None,
     ) -> AsyncPaginatedList:
         """Search albums matching the given query."""
-        return await self._search(path="album", query=query, strict=strict, ordering=ordering)
+        return await self._search(path="album", query=query, strict=strict, ordering=ordering, page_size=page_size)
 
     async def search_artists(
         self,
         query: str = "",
         strict: bool | None = None,
         ordering: str | None = None,
+        page_size: int | None = None,
     ) -> AsyncPaginatedList:
         """Search artists matching the given query."""
-        return await self._search(path="artist", query=query, strict=strict, ordering=ordering)
+        return await self._search(path="artist", query=query, strict=strict, ordering=ordering, page_size=page_size)
 
     async def search_playlists(
         self,
         query: str = "",
         strict: bool | None = None,
         ordering: str | None = None,
+        page_size: int | None = None,
     ) -> AsyncPaginatedList:
         """Search playlists matching the given query."""
-        return await self._search(path="playlist", query=query, strict=strict, ordering=ordering)
+        return await self._search(path="playlist", query=query, strict=strict, ordering=ordering, page_size=page_size)
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generic, TypeVar
-from urllib.parse import parse_qs, urlparse
+import asyncio
+import itertools
+import math
+from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from deezer.pagination import get_base_params, get_next_index, locate_element
 
 if TYPE_CHECKING:
     from deezer.asyncio.client import AsyncClient
@@ -16,6 +21,17 @@ class AsyncPaginatedList(Generic[ResourceType]):
 
     Instances should be created via the :meth:`create` classmethod,
     which fetches the first page of results eagerly.
+
+    :param page_size: the number of elements to fetch per request, sent as
+                      the ``limit`` parameter. Defaults to the ``page_size``
+                      of the client, or to the API default if not set.
+    :param read_ahead: the number of pages to fetch in background tasks while
+                       iterating, ahead of the page being consumed. Disabled
+                       by default. It may also be changed later, through the
+                       ``read_ahead`` attribute.
+    :param use_cache: whether the pages may be served from the cache of the
+                      client. Disable it to get the latest version of a list
+                      which may have changed.
     """
 
     def __init__(
@@ -24,16 +40,23 @@ class AsyncPaginatedList(Generic[ResourceType]):
         base_path: str,
         parent: AsyncResource | None = None,
         params: dict | None = None,
+        page_size: int | None = None,
+        read_ahead: int = 0,
+        use_cache: bool = True,
     ):
-        self.__elements: list[ResourceType] = []
+        self.read_ahead = read_ahead
+        self.use_cache = use_cache
         self.__client = client
         self.__base_path = base_path
-        self.__base_params = params or {}
-        self.__next_path: str | None = base_path
-        self.__next_params = params or {}
+        self.__base_params = get_base_params(params, page_size or client.page_size)
+        self.__start_index = int(self.__base_params.get("index", 0))
         self.__parent = parent
+        self.__pages: dict[int, list[ResourceType]] = {}
+        self.__page_size: int | None = None
+        self.__last_page: int | None = None
         self.__total: int | None = None
-        self.__iter_index = 0
+        self.__read_ahead_tasks: dict[int, asyncio.Task[dict[str, Any]]] = {}
+        self.__iter = self._async_iter()
 
     @classmethod
     async def create(
@@ -42,16 +65,27 @@ class AsyncPaginatedList(Generic[ResourceType]):
         base_path: str,
         parent: AsyncResource | None = None,
         params: dict | None = None,
+        page_size: int | None = None,
+        read_ahead: int = 0,
+        use_cache: bool = True,
     ) -> AsyncPaginatedList[ResourceType]:
         """Create an AsyncPaginatedList and fetch the first page."""
-        instance = cls(client=client, base_path=base_path, parent=parent, params=params)
-        await instance._grow()
+        instance = cls(
+            client=client,
+            base_path=base_path,
+            parent=parent,
+            params=params,
+            page_size=page_size,
+            read_ahead=read_ahead,
+            use_cache=use_cache,
+        )
+        await instance._get_page(0)
         return instance
 
     def __repr__(self) -> str:
         """Convenient representation giving a preview of the content."""
         repr_size = 5
-        data: list[ResourceType | str] = list(self.__elements[: repr_size + 1])
+        data: list[ResourceType | str] = list(self.__pages.get(0, [])[: repr_size + 1])
         if len(data) > repr_size:
             data[-1] = "..."
         return f"<{self.__class__.__name__} {data!r}>"
@@ -62,29 +96,20 @@ class AsyncPaginatedList(Generic[ResourceType]):
 
     async def _async_iter(self):
         """Iterate over elements, fetching new pages as needed."""
-        yield_index = 0
-        while True:
-            if yield_index < len(self.__elements):
-                yield self.__elements[yield_index]
-                yield_index += 1
-            elif self._could_grow():
-                await self._grow()
-            else:
-                break
+        try:
+            for page_number in itertools.count():
+                self._read_ahead(page_number)
+                page = await self._get_page(page_number)
+                for element in page:
+                    yield element
+                if not page or self._is_last_page(page_number):
+                    break
+        finally:
+            self._cancel_read_ahead()
 
     async def __anext__(self) -> ResourceType:
         """Get the next item from the list."""
-        if self.__iter_index < len(self.__elements):
-            item = self.__elements[self.__iter_index]
-            self.__iter_index += 1
-            return item
-        if self._could_grow():
-            new_elements = await self._grow()
-            if new_elements and self.__iter_index < len(self.__elements):
-                item = self.__elements[self.__iter_index]
-                self.__iter_index += 1
-                return item
-        raise StopAsyncIteration
+        return await self.__iter.__anext__()
 
     @property
     def total(self) -> int:
@@ -100,43 +125,171 @@ class AsyncPaginatedList(Generic[ResourceType]):
         """Get an item by index."""
         if index < 0:
             raise IndexError(f"Negative indexing is not supported: {index}")
-        await self._fetch_to_index(index)
-        if index >= len(self.__elements):
+        location = await self._locate(index)
+        if location is None:
             raise IndexError(f"list index out of range: {index}")
-        return self.__elements[index]
+        page_number, offset = location
+        return (await self._get_page(page_number))[offset]
+
+    async def collect(self, max_concurrency: int | None = None) -> list[ResourceType]:
+        """
+        Fetch all pages and return the full list of items.
+
+        :param max_concurrency: if given, fetch the remaining pages concurrently,
+                                with at most this number of requests at once.
+        """
+        if max_concurrency is not None:
+            await self.prefetch(max_concurrency=max_concurrency)
+        return [element async for element in self]
+
+    async def prefetch(self, max_concurrency: int = 4) -> None:
+        """
+        Fetch all the remaining pages concurrently.
+
+        The first page gives the total number of items, so the offsets of the
+        other pages can be computed and the pages fetched at the same time.
+        The pages are then available to iterate over the list without
+        further API calls.
+
+        :param max_concurrency: the maximum number of pages fetched at once.
+        """
+        await self._get_page(0)
+        missing_pages = [
+            page_number for page_number in range(1, self._get_page_count()) if page_number not in self.__pages
+        ]
+        if not missing_pages:
+            return
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_page(page_number: int) -> dict[str, Any]:
+            async with semaphore:
+                return await self._fetch_page(page_number)
+
+        payloads = await asyncio.gather(*(fetch_page(page_number) for page_number in missing_pages))
+        for page_number, response_payload in zip(missing_pages, payloads, strict=True):
+            self._store_page(page_number, response_payload)
+
+    async def iter_pages(self) -> AsyncGenerator[list[ResourceType], None]:
+        """
+        Iterate over the pages, without keeping them in the list.
+
+        Unlike iterating over the list, the pages fetched along the way
+        are handed over and not kept, so going through a very long list
+        uses a constant amount of memory. Iterating again will fetch the
+        pages again, apart from the first one, fetched on creation.
+        """
+        try:
+            for page_number in itertools.count():
+                self._read_ahead(page_number)
+                if page_number in self.__pages:
+                    page = self.__pages[page_number]
+                else:
+                    page = self._read_page(page_number, await self._get_page_payload(page_number))
+                yield page
+                if not page or self._is_last_page(page_number):
+                    return
+        finally:
+            self._cancel_read_ahead()
 
-    async def collect(self) -> list[ResourceType]:
-        """Fetch all pages and return the full list of items."""
-        while self._could_grow():
-            await self._grow()
-        return list(self.__elements)
+    async def stream(self) -> AsyncGenerator[ResourceType, None]:
+        """
+        Iterate over the elements, without keeping them in the list.
 
-    def _could_grow(self) -> bool:
-        return self.__next_path is not None
+        See :meth:`iter_pages` for details.
+        """
+        async for page in self.iter_pages():
+            for element in page:
+                yield element
 
-    async def _grow(self) -> list[ResourceType]:
-        new_elements = await self._fetch_next_page()
-        self.__elements.extend(new_elements)
-        return new_elements
+    async def _locate(self, index: int) -> tuple[int, int] | None:
+        """
+        Find the page containing the element at the given index.
 
-    async def _fetch_next_page(self) -> list[ResourceType]:
-        assert self.__next_path is not None  # noqa S101
-        response_payload = await self.__client.request(
+        See :meth:`PaginatedList._locate <deezer.PaginatedList._locate>`.
+
+        :returns: a tuple with the page number and the offset in that page,
+                  or ``None`` if the list doesn't have that many elements.
+        """
+        await self._get_page(0)
+        while True:
+            location = locate_element(self.__pages, self.__page_size, self.__last_page, index)
+            if location is None or location[0] in self.__pages:
+                return location
+            await self._get_page(location[0])
+
+    def _get_page_count(self) -> int:
+        """The number of pages, as far as we know from the total."""
+        if self.__last_page is not None:
+            return self.__last_page + 1
+        if not self.__total or not self.__page_size:
+            return len(self.__pages)
+        return math.ceil((self.__total - self.__start_index) / self.__page_size)
+
+    def _is_last_page(self, page_number: int) -> bool:
+        return self.__last_page is not None and page_number >= self.__last_page
+
+    def _read_ahead(self, page_number: int) -> None:
+        """Start fetching the ``read_ahead`` pages following the given one in background tasks."""
+        if not self.read_ahead:
+            return
+        last_page_number = min(page_number + self.read_ahead, self._get_page_count() - 1)
+        for next_page_number in range(page_number + 1, last_page_number + 1):
+            if next_page_number not in self.__pages and next_page_number not in self.__read_ahead_tasks:
+                task = asyncio.ensure_future(self._fetch_page(next_page_number))
+                self.__read_ahead_tasks[next_page_number] = task
+
+    def _cancel_read_ahead(self) -> None:
+        """Cancel the pages being read ahead, once the iteration is over."""
+        for page_number, task in list(self.__read_ahead_tasks.items()):
+            if task.done() and not task.cancelled() and task.exception() is None:
+                # Keep the pages already fetched, they may be used later
+                continue
+            task.cancel()
+            del self.__read_ahead_tasks[page_number]
+
+    async def _get_page(self, page_number: int) -> list[ResourceType]:
+        """Get the elements of the given page, fetching it if needed."""
+        if page_number not in self.__pages:
+            self._store_page(page_number, await self._get_page_payload(page_number))
+        return self.__pages[page_number]
+
+    async def _get_page_payload(self, page_number: int) -> dict[str, Any]:
+        """Get the response for the given page, from the read-ahead if available."""
+        task = self.__read_ahead_tasks.pop(page_number, None)
+        if task is not None:
+            return await task
+        return await self._fetch_page(page_number)
+
+    def _get_page_params(self, page_number: int) -> dict[str, Any]:
+        params = self.__base_params.copy()
+        if page_number > 0:
+            assert self.__page_size is not None  # noqa S101
+            params["index"] = self.__start_index + page_number * self.__page_size
+        return params
+
+    async def _fetch_page(self, page_number: int) -> dict[str, Any]:
+        return await self.__client.request(
             "GET",
-            self.__next_path,
+            self.__base_path,
             parent=self.__parent,
             paginate_list=True,
-            params=self.__next_params,
+            params=self._get_page_params(page_number),
+            use_cache=self.use_cache,
         )
-        self.__next_path = None
+
+    def _store_page(self, page_number: int, response_payload: dict[str, Any]) -> None:
+        self.__pages[page_number] = self._read_page(page_number, response_payload)
+
+    def _read_page(self, page_number: int, response_payload: dict[str, Any]) -> list[ResourceType]:
+        """Update what we know about the list from a page, and get its elements."""
+        elements = response_payload["data"]
         self.__total = response_payload.get("total")
         next_url = response_payload.get("next", None)
-        if next_url:
-            url_bits = urlparse(next_url)
-            self.__next_path = url_bits.path.lstrip("/")
-            self.__next_params = parse_qs(url_bits.query)
-        return response_payload["data"]
-
-    async def _fetch_to_index(self, index: int):
-        while len(self.__elements) <= index and self._could_grow():
-            await self._grow()
+        if self.__page_size is None:
+            # Deezer's default page size depends on the endpoint, but
+            # the first page tells us where the second one starts
+            next_index = get_next_index(next_url)
+            self.__page_size = next_index - self.__start_index if next_index is not None else len(elements)
+        if not next_url and (self.__last_page is None or page_number < self.__last_page):
+            self.__last_page = page_number
+        return elements
@@ -53,7 +53,7 @@ class AsyncAlbum(AsyncResource):
     _parse_release_date = staticmethod(parse_date)
 
     def _parse_contributors(self, raw_value):
-        return [AsyncArtist(client=self.client, json=val) for val in raw_value]
+        return [self.client._build_resource(AsyncArtist, val) for val in raw_value]
 
     async def get_artist(self) -> AsyncArtist:
         """
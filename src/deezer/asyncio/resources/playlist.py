@@ -3,7 +3,7 @@ from __future__ import annotations
 from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
-from deezer.utils import gen_ids
+from deezer.utils import MAX_IDS_PER_REQUEST, diff_ids, gen_ids, gen_ids_chunks
 
 from .resource import AsyncResource
 
@@ -45,15 +45,41 @@ class AsyncPlaylist(AsyncResource):
         """Mark the playlist as seen."""
         return await self.client.request("POST", f"playlist/{self.id}/seen")
 
-    async def add_tracks(self, tracks: Iterable[int]) -> bool:
-        """Add tracks to a playlist."""
-        track_ids_str = ",".join(str(tid) for tid in gen_ids(tracks))
-        return await self.client.request("POST", f"playlist/{self.id}/tracks", params={"songs": track_ids_str})
+    async def add_tracks(self, tracks: Iterable[int], chunk_size: int = MAX_IDS_PER_REQUEST) -> bool:
+        """Add tracks to a playlist, in chunks of at most ``chunk_size`` tracks."""
+        return await self._update_tracks("POST", tracks, chunk_size)
 
-    async def delete_tracks(self, tracks: Iterable[int]) -> bool:
-        """Delete tracks from a playlist."""
-        track_ids_str = ",".join(map(str, gen_ids(tracks)))
-        return await self.client.request("DELETE", f"playlist/{self.id}/tracks", params={"songs": track_ids_str})
+    async def delete_tracks(self, tracks: Iterable[int], chunk_size: int = MAX_IDS_PER_REQUEST) -> bool:
+        """Delete tracks from a playlist, in chunks of at most ``chunk_size`` tracks."""
+        return await self._update_tracks("DELETE", tracks, chunk_size)
+
+    async def _update_tracks(self, method: str, tracks: Iterable[int], chunk_size: int) -> bool:
+        """Add or delete tracks, in chunks, and tell whether all the chunks were successful."""
+        results = [
+            await self.client.request(method, f"playlist/{self.id}/tracks", params={"songs": track_ids_str})
+            for track_ids_str in gen_ids_chunks(tracks, chunk_size)
+        ]
+        return all(results)
+
+    async def sync_tracks(self, tracks: Iterable[int]) -> bool:
+        """
+        Update the playlist to have the given tracks, in the given order, with as few requests as possible.
+
+        See :meth:`Playlist.sync_tracks <deezer.Playlist.sync_tracks>` for details.
+        """
+        wanted_ids = list(dict.fromkeys(gen_ids(tracks)))
+        current_tracks = await self.get_tracks()
+        current_ids = [track.id async for track in current_tracks.stream()]
+        can_reorder = len(list(gen_ids_chunks(wanted_ids))) <= 1
+        removed_ids, added_ids, reorder = diff_ids(current_ids, wanted_ids, can_reorder)
+        results = []
+        if removed_ids:
+            results.append(await self.delete_tracks(removed_ids))
+        if added_ids:
+            results.append(await self.add_tracks(added_ids))
+        if reorder:
+            results.append(await self.reorder_tracks(wanted_ids))
+        return all(results)
 
     async def reorder_tracks(self, order: Iterable[int]) -> bool:
         """Reorder the tracks of a playlist."""
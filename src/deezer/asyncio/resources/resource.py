@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Any
+from collections.abc import Callable
+from typing import Any, ClassVar
 
 from deezer.asyncio.pagination import AsyncPaginatedList
+from deezer.resources.resource import ResourceMeta, get_fields_tuple
 
 
-class AsyncResource:
+class AsyncResource(metaclass=ResourceMeta):
     """
     Base class for async resources.
 
@@ -14,21 +16,106 @@ class AsyncResource:
     traversing relations via the async client.
     """
 
+    __slots__ = ("__dict__", "__weakref__", "_fields", "_parent", "_raw", "client", "id", "type")
+
     id: int
     type: str
 
     _fields: tuple[str, ...]
+    _raw: dict[str, Any] | None
+    _parent: AsyncResource | None
+    _field_parsers: ClassVar[dict[str, Callable[[Any, Any], Any]]]
 
     def __init__(self, client, json):
         self.client = client
-        for field_name in json.keys():
-            parse_func = getattr(self, f"_parse_{field_name}", None)
-            if callable(parse_func):
-                json[field_name] = parse_func(json[field_name])
-        self._fields = tuple(json.keys())
+        self._raw = None
+        self._parent = None
+        self._fields = ()
+        self._set_fields(json)
+
+    def _set_fields(self, json: dict[str, Any]) -> None:
+        """Set the fields from the API response, and add them to the known fields."""
+        if self._fields:
+            field_names = (*self._fields, *(key for key in json if key not in self._fields))
+        else:
+            field_names = tuple(json)
+        if getattr(self.client, "lazy_parsing", False):
+            raw = {key: json.pop(key) for key in list(json) if self._needs_parsing(key, json[key])}
+            if raw:
+                self._raw = {**self._raw, **raw} if self._raw else raw
+        else:
+            for field_name, parse_func in self._field_parsers.items():
+                if field_name in json:
+                    json[field_name] = parse_func(self, json[field_name])
+        self._fields = get_fields_tuple(field_names)
         for key in json:
             setattr(self, key, json[key])
 
+    def _merge_fields(self, json: dict[str, Any]) -> None:
+        """Update the fields from another response for the same resource, keeping the other ones."""
+        if self._raw:
+            for key in json:
+                self._raw.pop(key, None)
+            self._raw = self._raw or None
+        field_names = list(json)
+        self._set_fields(json)
+        if self._raw:
+            # The fields kept raw again mustn't be hidden by their previous value
+            for field_name in field_names:
+                if field_name in self._raw:
+                    try:
+                        object.__delattr__(self, field_name)
+                    except AttributeError:
+                        pass
+
+    def __getattr__(self, item: str) -> Any:
+        """Convert the fields kept raw for lazy parsing, when first accessed."""
+        if item != "_raw" and self._raw and item in self._raw:
+            return self._convert_raw_field(item)
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{item}'")
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the state of the resource, to copy or pickle it, from the attributes already set."""
+        state = dict(self.__dict__)
+        for name in ("client", "_fields", "_raw", "_parent", *self._fields):
+            try:
+                state[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state of a copied or unpickled resource."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def _update_from(self, full_resource: AsyncResource) -> None:
+        """Add the fields of the full resource, fetched from the API, which this one doesn't have."""
+        if full_resource is self:
+            return
+        missing_fields = [field_name for field_name in full_resource._fields if field_name not in self._fields]
+        for field_name in missing_fields:
+            setattr(self, field_name, getattr(full_resource, field_name))
+        self._fields = get_fields_tuple((*self._fields, *missing_fields))
+
+    def _needs_parsing(self, field_name: str, value: Any) -> bool:
+        """Whether the raw value of a field needs to be converted."""
+        return field_name in self._field_parsers or self.client._is_nested_json(value)
+
+    def _convert_raw_field(self, field_name: str) -> Any:
+        """Convert the raw value of a field kept for lazy parsing, and set it."""
+        assert self._raw is not None  # noqa S101
+        value = self._raw.pop(field_name)
+        if not self._raw:
+            self._raw = None
+        if self.client._is_nested_json(value):
+            value = self.client._process_json(value, self._parent)
+        parse_func = self._field_parsers.get(field_name)
+        if parse_func is not None:
+            value = parse_func(self, value)
+        setattr(self, field_name, value)
+        return value
+
     def __repr__(self):
         """Convenient representation giving a preview of the item."""
         name = getattr(self, "name", None)
@@ -93,6 +180,8 @@ class AsyncResource:
         self,
         relation: str,
         params: dict | None = None,
+        page_size: int | None = None,
+        use_cache: bool = True,
     ) -> AsyncPaginatedList:
         """Build the pagination object based on the relation."""
         return await AsyncPaginatedList.create(
@@ -100,4 +189,6 @@ class AsyncResource:
             base_path=f"{self.type}/{self.id}/{relation}",
             parent=self,
             params=params,
+            page_size=page_size,
+            use_cache=use_cache,
         )
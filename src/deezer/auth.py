@@ -1,8 +1,14 @@
+import hashlib
 import typing
 
 import httpx
 
 
+def get_token_digest(access_token: str) -> str:
+    """Get a digest identifying an access token, without revealing it."""
+    return hashlib.sha256(access_token.encode()).hexdigest()[:16]
+
+
 class DeezerQueryAuth(httpx.Auth):
     """
     Deezer Auth for httpx.
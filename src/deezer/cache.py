@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+
+DEFAULT_TTL = 300
+DEFAULT_ENDPOINT_TTLS: dict[str, float] = {
+    "chart": 60 * 60,
+    "genre": 24 * 60 * 60,
+    "radio": 24 * 60 * 60,
+}
+
+
+class BaseCache:
+    """
+    Base class for the responses caches.
+
+    A cache stores the raw body of successful ``GET`` responses, keyed by
+    the HTTP method, the path and the query parameters of the request.
+    Entries expire after a time to live which depends on the endpoint,
+    that is the first segment of the path (``artist``, ``chart``, ...).
+
+    :param ttl: default time to live of entries, in seconds.
+    :param endpoint_ttls: time to live overrides by endpoint, in seconds.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        endpoint_ttls: Mapping[str, float] | None = None,
+    ):
+        self.ttl = ttl
+        self.endpoint_ttls = {**DEFAULT_ENDPOINT_TTLS, **(endpoint_ttls or {})}
+
+    def get_ttl(self, endpoint: str) -> float:
+        """Get the time to live of the entries for the given endpoint."""
+        return self.endpoint_ttls.get(endpoint, self.ttl)
+
+    def get(self, key: str) -> bytes | None:
+        """Get the content stored for the given key, if not expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, content: bytes, endpoint: str) -> None:
+        """Store the content for the given key."""
+        raise NotImplementedError
+
+    def delete(self, path: str) -> None:
+        """
+        Remove the entries for the requests to the given path, or below it.
+
+        All the entries are removed, whatever their query parameters, e.g.
+        the pages of ``playlist/1/tracks`` for ``playlist/1``.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove all the entries from the cache."""
+        raise NotImplementedError
+
+
+def get_path_key_prefixes(path: str) -> tuple[str, tuple[str, ...]]:
+    """
+    Get the prefixes of the keys of the requests to the given path, or below it.
+
+    :returns: a tuple with the key of the request without query parameters,
+              and the prefixes of the other keys, one character longer.
+    """
+    key = f"GET {path.strip('/')}"
+    return key, (f"{key}?", f"{key}/", f"{key} ")
+
+
+class MemoryCache(BaseCache):
+    """
+    An in-memory cache, evicting the least recently used entries.
+
+        >>> import deezer
+        >>> from deezer.cache import MemoryCache
+        >>> client = deezer.Client(cache=MemoryCache(maxsize=1024))
+
+    :param maxsize: the maximum number of entries to keep.
+    :param ttl: default time to live of entries, in seconds.
+    :param endpoint_ttls: time to live overrides by endpoint, in seconds.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = DEFAULT_TTL,
+        endpoint_ttls: Mapping[str, float] | None = None,
+    ):
+        super().__init__(ttl=ttl, endpoint_ttls=endpoint_ttls)
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of entries currently stored."""
+        return len(self._entries)
+
+    def get(self, key: str) -> bytes | None:
+        """Get the content stored for the given key, if not expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, content = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return content
+
+    def set(self, key: str, content: bytes, endpoint: str) -> None:
+        """Store the content for the given key."""
+        expires_at = time.time() + self.get_ttl(endpoint)
+        with self._lock:
+            self._entries[key] = (expires_at, content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, path: str) -> None:
+        """Remove the entries for the requests to the given path, or below it."""
+        key, prefixes = get_path_key_prefixes(path)
+        with self._lock:
+            for entry_key in [k for k in self._entries if k == key or k[: len(key) + 1] in prefixes]:
+                del self._entries[entry_key]
+
+    def clear(self) -> None:
+        """Remove all the entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(BaseCache):
+    """
+    A persistent cache, storing the responses in a SQLite database.
+
+    The entries survive restarts of the process, which helps batch jobs
+    to avoid fetching again what they already fetched in a previous run.
+
+        >>> import deezer
+        >>> from deezer.cache import SQLiteCache
+        >>> client = deezer.Client(cache=SQLiteCache("deezer-cache.sqlite"))
+
+    :param path: the path to the database file, created if it doesn't exist.
+    :param ttl: default time to live of entries, in seconds.
+    :param endpoint_ttls: time to live overrides by endpoint, in seconds.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        ttl: float = DEFAULT_TTL,
+        endpoint_ttls: Mapping[str, float] | None = None,
+    ):
+        super().__init__(ttl=ttl, endpoint_ttls=endpoint_ttls)
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "endpoint TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, "
+                "content BLOB NOT NULL"
+                ")"
+            )
+
+    def __len__(self) -> int:
+        """Get the number of entries currently stored."""
+        with self._lock:
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return count
+
+    def get(self, key: str) -> bytes | None:
+        """Get the content stored for the given key, if not expired."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT expires_at, content FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            expires_at, content = row
+            if expires_at <= time.time():
+                with self._connection:
+                    self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+        return bytes(content)
+
+    def set(self, key: str, content: bytes, endpoint: str) -> None:
+        """Store the content for the given key."""
+        expires_at = time.time() + self.get_ttl(endpoint)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, expires_at, content) VALUES (?, ?, ?, ?)",
+                (key, endpoint, expires_at, content),
+            )
+
+    def delete(self, path: str) -> None:
+        """Remove the entries for the requests to the given path, or below it."""
+        key, prefixes = get_path_key_prefixes(path)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM responses WHERE key = ? OR substr(key, 1, ?) IN (?, ?, ?)",
+                (key, len(key) + 1, *prefixes),
+            )
+
+    def clear(self) -> None:
+        """Remove all the entries from the cache."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def delete_expired(self) -> None:
+        """Remove the expired entries from the database."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from deezer.asyncio import AsyncClient
+    from deezer.asyncio.pagination import AsyncPaginatedList
+    from deezer.client import Client
+    from deezer.pagination import PaginatedList
+
+
+class PlaylistChangeTracker:
+    """
+    Keep track of the checksums of playlists, to skip the unchanged ones.
+
+    Deezer gives a checksum of the tracks of each playlist, which changes
+    when the tracks change. The tracker remembers the last checksum seen
+    for each playlist, so the tracks of a playlist polled regularly are
+    only fetched when they changed since the last time:
+
+        >>> import deezer
+        >>> from deezer.changes import PlaylistChangeTracker
+        >>> tracker = PlaylistChangeTracker()
+        >>> client = deezer.Client()
+        >>> tracks = tracker.get_tracks_if_changed(client, 908622995)
+
+    The checksums are kept in a dictionary by default. Any mutable mapping
+    may be given instead, to keep them between runs for example.
+
+    :param checksums: a mapping of the last checksums seen, by playlist ID.
+    """
+
+    def __init__(self, checksums: MutableMapping[int, str] | None = None):
+        self.checksums = checksums if checksums is not None else {}
+
+    def has_changed(self, playlist: Any) -> bool:
+        """Whether the tracks of the playlist changed since its checksum was remembered."""
+        return self.checksums.get(playlist.id) != playlist.checksum
+
+    def remember(self, playlist: Any) -> None:
+        """Remember the current checksum of the playlist."""
+        self.checksums[playlist.id] = playlist.checksum
+
+    def forget(self, playlist_id: int) -> None:
+        """Forget the checksum of the playlist, so its tracks are fetched next time."""
+        self.checksums.pop(playlist_id, None)
+
+    def get_tracks_if_changed(self, client: Client, playlist_id: int, **kwargs) -> PaginatedList | None:
+        """
+        Get the tracks of a playlist, unless they didn't change since last time.
+
+        The playlist is fetched to get its checksum, and its tracks are only
+        fetched if it changed. Both bypass the cache of the client, which
+        could hold a previous version of them. The new checksum is
+        remembered right away: call :meth:`forget` if processing the tracks
+        fails, to get them again next time.
+
+        :param client: the client to fetch the playlist with.
+        :param playlist_id: the ID of the playlist.
+        :param kwargs: passed on to :meth:`Playlist.get_tracks <deezer.Playlist.get_tracks>`.
+        :returns: a :class:`PaginatedList <deezer.PaginatedList>` of
+                  :class:`Track <deezer.Track>` instances, or ``None``
+                  if the tracks didn't change.
+        """
+        playlist = client.request("GET", f"playlist/{playlist_id}", use_cache=False)
+        if not self.has_changed(playlist):
+            return None
+        self.remember(playlist)
+        return playlist.get_tracks(use_cache=False, **kwargs)
+
+    async def async_get_tracks_if_changed(
+        self,
+        client: AsyncClient,
+        playlist_id: int,
+        **kwargs,
+    ) -> AsyncPaginatedList | None:
+        """
+        Get the tracks of a playlist, unless they didn't change since last time.
+
+        Same as :meth:`get_tracks_if_changed`, with the async client.
+        """
+        playlist = await client.request("GET", f"playlist/{playlist_id}", use_cache=False)
+        if not self.has_changed(playlist):
+            return None
+        self.remember(playlist)
+        return await playlist.get_tracks(use_cache=False, **kwargs)
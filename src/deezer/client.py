@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import json
+import time
+from collections.abc import Callable, Collection, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from weakref import WeakValueDictionary
+
 import httpx
 from httpx._types import HeaderTypes
 
 from deezer._mixin import DeezerMixin
-from deezer.auth import DeezerQueryAuth
-from deezer.exceptions import (
-    DeezerErrorResponse,
-    DeezerHTTPError,
-)
+from deezer.auth import DeezerQueryAuth, get_token_digest
+from deezer.cache import BaseCache
+from deezer.events import RequestEvent
+from deezer.exceptions import DeezerAPIException, DeezerErrorResponse, DeezerHTTPError
 from deezer.pagination import PaginatedList
+from deezer.ratelimit import RateLimiter
 from deezer.resources import (
     Album,
     Artist,
@@ -24,6 +31,7 @@ from deezer.resources import (
     Track,
     User,
 )
+from deezer.retry import Retry
 
 
 class Client(DeezerMixin, httpx.Client):
@@ -47,15 +55,51 @@ class Client(DeezerMixin, httpx.Client):
 
     :param access_token: user access token.
     :param headers: a dictionary of headers to be used.
+    :param cache: an optional :class:`~deezer.cache.BaseCache` to store the
+                  responses of ``GET`` requests.
+    :param rate_limiter: an optional :class:`~deezer.ratelimit.RateLimiter`
+                         to pace the requests sent to the API.
+    :param retry: an optional :class:`~deezer.retry.Retry` policy for
+                  the requests failing with a temporary error.
+    :param page_size: the default number of elements to fetch per request
+                      for the paginated lists, instead of the API default.
+    :param lazy_parsing: whether to defer the parsing of the fields needing
+                         conversion, like dates and nested resources, until
+                         they're first accessed.
+    :param identity_map: whether the resources with the same type and ID
+                         should be the same object, as long as it's in use.
+    :param json_loads: the function decoding the JSON content of the responses,
+                       from bytes. Defaults to :func:`json.loads`, a faster
+                       decoder like ``orjson.loads`` may be given instead.
+    :param observers: functions called with a :class:`~deezer.events.RequestEvent`
+                      after each request, to monitor them. More may be added
+                      later to the ``observers`` list.
     """
 
     def __init__(
         self,
         access_token: str | None = None,
         headers: HeaderTypes | None = None,
+        cache: BaseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: Retry | None = None,
+        page_size: int | None = None,
+        lazy_parsing: bool = False,
+        identity_map: bool = False,
+        json_loads: Callable[[bytes], Any] | None = None,
+        observers: Iterable[Callable[[RequestEvent], None]] | None = None,
     ):
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.page_size = page_size
+        self.lazy_parsing = lazy_parsing
+        self._identity_map = WeakValueDictionary() if identity_map else None
+        self.json_loads = json_loads or json.loads
+        self.observers = list(observers or ())
         if access_token:
             deezer_auth = DeezerQueryAuth(access_token=access_token)
+            self._token_digest = get_token_digest(access_token)
         else:
             deezer_auth = None
         super().__init__(
@@ -72,6 +116,7 @@ class Client(DeezerMixin, httpx.Client):
         resource_type: type[Resource] | None = None,
         resource_id: int | None = None,
         paginate_list=False,
+        use_cache: bool = True,
         **kwargs,
     ):
         """
@@ -83,31 +128,190 @@ class Client(DeezerMixin, httpx.Client):
         :param resource_type: The resource class to use as top level.
         :param resource_id: The resource id to use as top level.
         :param paginate_list: Whether to wrap list into a pagination object.
+        :param use_cache: Whether a cached response may be used. The response
+                          received is cached either way.
         """
-        response = super().request(
-            method,
-            path,
-            **kwargs,
-        )
+        event = RequestEvent(method, path)
+        try:
+            return self._request(
+                method,
+                path,
+                event,
+                parent,
+                resource_type,
+                resource_id,
+                paginate_list,
+                use_cache,
+                **kwargs,
+            )
+        except Exception as exc:
+            event.error = exc
+            raise
+        finally:
+            self._notify_observers(event)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        event: RequestEvent,
+        parent: Resource | None,
+        resource_type: type[Resource] | None,
+        resource_id: int | None,
+        paginate_list: bool,
+        use_cache: bool,
+        **kwargs,
+    ):
+        """Make a request to the API and parse the response, recording the details in the event."""
+        request_key = self._get_request_key(method, path, kwargs.get("params"))
+        content = self._get_cached(request_key) if use_cache else None
+        if content is not None:
+            event.cache_hit = True
+            event.response_size = len(content)
+            start = time.perf_counter()
+            json_data = self.json_loads(content)
+        else:
+            _, json_data = self._request_with_retry(method, path, request_key, event, **kwargs)
+            start = time.perf_counter()
+        try:
+            if not isinstance(json_data, dict):
+                return json_data
+            return self._process_json(
+                json_data,
+                parent=parent,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                paginate_list=paginate_list,
+            )
+        finally:
+            event.parse_time += time.perf_counter() - start
+
+    def _request_with_retry(self, method: str, path: str, request_key: str | None, event: RequestEvent, **kwargs):
+        """Send a request to the API, retrying it according to the retry policy."""
+        attempt = 0
+        while True:
+            try:
+                return self._request_once(method, path, request_key, event, **kwargs)
+            except (httpx.TransportError, DeezerAPIException) as exc:
+                delay = self._get_retry_delay(method, exc, attempt)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+            event.retries = attempt
+
+    def _request_once(self, method: str, path: str, request_key: str | None, event: RequestEvent, **kwargs):
+        """
+        Send a single request to the API and decode the response.
+
+        :returns: a tuple with the raw content and the decoded response.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        start = time.perf_counter()
+        try:
+            response = super().request(
+                method,
+                path,
+                **kwargs,
+            )
+        finally:
+            event.network_time += time.perf_counter() - start
+        event.status_code = response.status_code
+        event.response_size = len(response.content)
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
             raise DeezerHTTPError.from_http_error(exc) from exc
-        json_data = response.json()
-        if not isinstance(json_data, dict):
-            return json_data
-        if json_data.get("error"):
-            raise DeezerErrorResponse(json_data)
-        return self._process_json(
-            json_data,
-            parent=parent,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            paginate_list=paginate_list,
+        start = time.perf_counter()
+        json_data = self.json_loads(response.content)
+        event.parse_time += time.perf_counter() - start
+        self._raise_for_error(json_data)
+        if method.upper() == "GET":
+            self._set_cached(request_key, path, response.content)
+        else:
+            self._evict_cached(path)
+        return response.content, json_data
+
+    def _get_paginated_list(self, path: str, params: dict | None = None, page_size: int | None = None):
+        return PaginatedList(client=self, base_path=path, params=params, page_size=page_size)
+
+    def hydrate(
+        self,
+        resources: Iterable[Resource],
+        fields: Collection[str] | None = None,
+        max_workers: int = 4,
+    ) -> list[Resource]:
+        """
+        Fetch the full version of the given resources, and complete them in place.
+
+        Accessing a field missing from a partial resource, like the tracks
+        of a search, fetches the full resource, one resource at a time. This
+        fetches them all concurrently instead, using a pool of threads. The
+        resources with the same type and ID are fetched once.
+
+            >>> tracks = client.search("Daft Punk")[:25]
+            >>> client.hydrate(tracks, fields=["bpm"])
+
+        :param resources: the resources to complete.
+        :param fields: the fields needed, to only fetch the resources missing
+                       some of them. By default, all the resources are fetched.
+        :param max_workers: the maximum number of resources fetched at once.
+        :returns: the given resources, as a list. The ones which couldn't be
+                  fetched are left partial.
+        """
+        resources = list(resources)
+        groups = self._group_resources_to_hydrate(resources, fields)
+        full_resources = self._get_many(
+            (f"{resource_type}/{resource_id}" for resource_type, resource_id in groups),
+            max_workers=max_workers,
         )
+        for group, full_resource in zip(groups.values(), full_resources, strict=True):
+            if isinstance(full_resource, Exception):
+                continue
+            for resource in group:
+                resource._update_from(full_resource)
+        return resources
+
+    def _get_many(self, paths: Iterable[str], max_workers: int, resolve: bool = False) -> list:
+        """
+        Get the resources at the given paths concurrently, in the same order.
+
+        Each path is requested once. The resources which couldn't be fetched
+        are replaced by the exception raised.
 
-    def _get_paginated_list(self, path: str, params: dict | None = None):
-        return PaginatedList(client=self, base_path=path, params=params)
+        :param resolve: whether the resources not found are ``None``,
+                        see :meth:`_resolve`, rather than an exception.
+        """
+        paths = list(paths)
+
+        def get_resource(path: str):
+            try:
+                return self._resolve(path) if resolve else self.request("GET", path)
+            except (httpx.TransportError, DeezerAPIException) as exc:
+                return exc
+
+        unique_paths = list(dict.fromkeys(paths))
+        if not unique_paths:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = dict(zip(unique_paths, executor.map(get_resource, unique_paths), strict=True))
+        return [results[path] for path in paths]
+
+    def _resolve(self, path: str):
+        """
+        Get the resource at the given path, or ``None`` if there's none.
+
+        With a cache, the resources not found are cached as well, to
+        avoid asking again for them.
+        """
+        try:
+            return self.request("GET", path)
+        except DeezerErrorResponse as exc:
+            if not self._is_not_found(exc):
+                raise
+        self._set_not_found(path)
+        return None
 
     def get_album(self, album_id: int) -> Album:
         """
@@ -125,6 +329,54 @@ class Client(DeezerMixin, httpx.Client):
         """
         return self.request("GET", f"artist/{artist_id}")
 
+    def get_albums(self, album_ids: Iterable[int], max_workers: int = 4) -> list[Album | Exception]:
+        """
+        Get the albums with the given IDs, concurrently.
+
+        The albums are in the same order as the IDs. An album which couldn't
+        be fetched, for instance because it doesn't exist, is replaced by the
+        exception raised, without failing the other ones.
+
+        :param album_ids: the IDs of the albums.
+        :param max_workers: the maximum number of albums fetched at once.
+        :returns: a list of :class:`~deezer.Album` objects, or exceptions.
+        """
+        return self._get_many((f"album/{album_id}" for album_id in album_ids), max_workers)
+
+    def get_album_by_upc(self, upc: str) -> Album | None:
+        """
+        Get the album with the given UPC (Universal Product Code).
+
+        :returns: an :class:`~deezer.Album` object, or ``None`` if there's
+                  no album with this UPC.
+        """
+        return self._resolve(f"album/upc:{upc.strip()}")
+
+    def get_albums_by_upc(self, upcs: Iterable[str], max_workers: int = 4) -> list[Album | Exception | None]:
+        """
+        Get the albums with the given UPCs, concurrently.
+
+        The albums are in the same order as the UPCs, with ``None`` for the
+        UPCs without album. See :meth:`get_albums` for details.
+
+        :param upcs: the UPCs of the albums.
+        :param max_workers: the maximum number of albums fetched at once.
+        :returns: a list of :class:`~deezer.Album` objects, ``None`` or exceptions.
+        """
+        return self._get_many((f"album/upc:{upc.strip()}" for upc in upcs), max_workers, resolve=True)
+
+    def get_artists(self, artist_ids: Iterable[int], max_workers: int = 4) -> list[Artist | Exception]:
+        """
+        Get the artists with the given IDs, concurrently.
+
+        See :meth:`get_albums` for details.
+
+        :param artist_ids: the IDs of the artists.
+        :param max_workers: the maximum number of artists fetched at once.
+        :returns: a list of :class:`~deezer.Artist` objects, or exceptions.
+        """
+        return self._get_many((f"artist/{artist_id}" for artist_id in artist_ids), max_workers)
+
     def get_chart(self, genre_id: int = 0) -> Chart:
         """
         Get overall charts for tracks, albums, artists and playlists for the given genre ID.
@@ -189,14 +441,15 @@ class Client(DeezerMixin, httpx.Client):
         """
         return self.request("GET", f"editorial/{editorial_id}")
 
-    def list_editorials(self) -> PaginatedList[Editorial]:
+    def list_editorials(self, page_size: int | None = None) -> PaginatedList[Editorial]:
         """
         List editorials.
 
+        :param page_size: the number of elements to fetch per request.
         :returns: a :class:`~deezer.pagination.PaginatedList`
                   of :class:`~deezer.Editorial` objects.
         """
-        return self._get_paginated_list("editorial")
+        return self._get_paginated_list("editorial", page_size=page_size)
 
     def get_episode(self, episode_id: int) -> Episode:
         """
@@ -254,14 +507,15 @@ class Client(DeezerMixin, httpx.Client):
         """
         return self.request("GET", "radio")
 
-    def get_radios_top(self) -> PaginatedList[Radio]:
+    def get_radios_top(self, page_size: int | None = None) -> PaginatedList[Radio]:
         """
         Get the top radios.
 
+        :param page_size: the number of elements to fetch per request.
         :returns: a :class:`~deezer.pagination.PaginatedList`
                   of :class:`~deezer.Radio` objects.
         """
-        return self._get_paginated_list("radio/top")
+        return self._get_paginated_list("radio/top", page_size=page_size)
 
     def get_track(self, track_id: int) -> Track:
         """
@@ -271,6 +525,40 @@ class Client(DeezerMixin, httpx.Client):
         """
         return self.request("GET", f"track/{track_id}")
 
+    def get_tracks(self, track_ids: Iterable[int], max_workers: int = 4) -> list[Track | Exception]:
+        """
+        Get the tracks with the given IDs, concurrently.
+
+        See :meth:`get_albums` for details.
+
+        :param track_ids: the IDs of the tracks.
+        :param max_workers: the maximum number of tracks fetched at once.
+        :returns: a list of :class:`~deezer.Track` objects, or exceptions.
+        """
+        return self._get_many((f"track/{track_id}" for track_id in track_ids), max_workers)
+
+    def get_track_by_isrc(self, isrc: str) -> Track | None:
+        """
+        Get the track with the given ISRC (International Standard Recording Code).
+
+        :returns: a :class:`~deezer.Track` object, or ``None`` if there's
+                  no track with this ISRC.
+        """
+        return self._resolve(f"track/isrc:{isrc.strip().upper()}")
+
+    def get_tracks_by_isrc(self, isrcs: Iterable[str], max_workers: int = 4) -> list[Track | Exception | None]:
+        """
+        Get the tracks with the given ISRCs, concurrently.
+
+        The tracks are in the same order as the ISRCs, with ``None`` for the
+        ISRCs without track. See :meth:`get_albums` for details.
+
+        :param isrcs: the ISRCs of the tracks.
+        :param max_workers: the maximum number of tracks fetched at once.
+        :returns: a list of :class:`~deezer.Track` objects, ``None`` or exceptions.
+        """
+        return self._get_many((f"track/isrc:{isrc.strip().upper()}" for isrc in isrcs), max_workers, resolve=True)
+
     def get_user(self, user_id: int | None = None) -> User:
         """
         Get the user with the given ID.
@@ -325,16 +613,17 @@ class Client(DeezerMixin, httpx.Client):
         """
         return PaginatedList(client=self, base_path="user/me/flow", **kwargs)
 
-    def get_user_albums(self, user_id: int | None = None) -> PaginatedList[Album]:
+    def get_user_albums(self, user_id: int | None = None, page_size: int | None = None) -> PaginatedList[Album]:
         """
         Get the favourites albums for the given user_id if provided or current user if not.
 
         :param user_id: the user ID to get favourites albums.
+        :param page_size: the number of elements to fetch per request.
         :returns: a :class:`~deezer.pagination.PaginatedList`
                   of :class:`~deezer.Album` objects.
         """
         user_id_str = str(user_id) if user_id else "me"
-        return self._get_paginated_list(f"user/{user_id_str}/albums")
+        return self._get_paginated_list(f"user/{user_id_str}/albums", page_size=page_size)
 
     def add_user_album(self, album_id: int) -> bool:
         """
@@ -354,16 +643,17 @@ class Client(DeezerMixin, httpx.Client):
         """
         return self.request("DELETE", "user/me/albums", params={"album_id": album_id})
 
-    def get_user_artists(self, user_id: int | None = None) -> PaginatedList[Artist]:
+    def get_user_artists(self, user_id: int | None = None, page_size: int | None = None) -> PaginatedList[Artist]:
         """
         Get the favourites artists for the given user_id if provided or current user if not.
 
         :param user_id: the user ID to get favourites artists.
+        :param page_size: the number of elements to fetch per request.
         :return: a :class:`~deezer.pagination.PaginatedList`
                  of :class:`~deezer.Artist` instances.
         """
         user_id_str = str(user_id) if user_id else "me"
-        return self._get_paginated_list(f"user/{user_id_str}/artists")
+        return self._get_paginated_list(f"user/{user_id_str}/artists", page_size=page_size)
 
     def add_user_artist(self, artist_id: int) -> bool:
         """
@@ -387,27 +677,29 @@ class Client(DeezerMixin, httpx.Client):
             params={"artist_id": artist_id},
         )
 
-    def get_user_followers(self, user_id: int | None = None) -> PaginatedList[User]:
+    def get_user_followers(self, user_id: int | None = None, page_size: int | None = None) -> PaginatedList[User]:
         """
         Get the followers for the given user_id if provided or current user if not.
 
         :param user_id: the user ID to get followers.
+        :param page_size: the number of elements to fetch per request.
         :returns: a :class:`~deezer.pagination.PaginatedList`
                  of :class:`~deezer.User` instances.
         """
         user_id_str = str(user_id) if user_id else "me"
-        return self._get_paginated_list(f"user/{user_id_str}/followers")
+        return self._get_paginated_list(f"user/{user_id_str}/followers", page_size=page_size)
 
-    def get_user_followings(self, user_id: int | None = None) -> PaginatedList[User]:
+    def get_user_followings(self, user_id: int | None = None, page_size: int | None = None) -> PaginatedList[User]:
         """
         Get the followings for the given user_id if provided or current user if not.
 
         :param user_id: the user ID to get followings.
+        :param page_size: the number of elements to fetch per request.
         :returns: a :class:`~deezer.pagination.PaginatedList`
                  of :class:`~deezer.User` instances.
         """
         user_id_str = str(user_id) if user_id else "me"
-        return self._get_paginated_list(f"user/{user_id_str}/followings")
+        return self._get_paginated_list(f"user/{user_id_str}/followings", page_size=page_size)
 
     def add_user_following(self, user_id: int) -> bool:
         """
@@ -427,25 +719,27 @@ class Client(DeezerMixin, httpx.Client):
         """
         return self.request("DELETE", "user/me/followings", params={"user_id": user_id})
 
-    def get_user_history(self) -> PaginatedList[Track]:
+    def get_user_history(self, page_size: int | None = None) -> PaginatedList[Track]:
         """
         Returns a list of the recently played tracks for the current user.
 
+        :param page_size: the number of elements to fetch per request.
         :return: a :class:`~deezer.pagination.PaginatedList`
                  of :class:`~deezer.Track` instances.
         """
-        return self._get_paginated_list("user/me/history")
+        return self._get_paginated_list("user/me/history", page_size=page_size)
 
-    def get_user_tracks(self, user_id: int | None = None) -> PaginatedList[Track]:
+    def get_user_tracks(self, user_id: int | None = None, page_size: int | None = None) -> PaginatedList[Track]:
         """
         Get the favourites tracks for the given user_id if provided or current user if not.
 
         :param user_id: the user ID to get favourites tracks.
+        :param page_size: the number of elements to fetch per request.
         :return: a :class:`~deezer.pagination.PaginatedList`
                  of :class:`~deezer.Track` instances.
         """
         user_id_str = str(user_id) if user_id else "me"
-        return self._get_paginated_list(f"user/{user_id_str}/tracks")
+        return self._get_paginated_list(f"user/{user_id_str}/tracks", page_size=page_size)
 
     def add_user_track(self, track_id: int) -> bool:
         """
@@ -510,6 +804,7 @@ class Client(DeezerMixin, httpx.Client):
         query: str = "",
         strict: bool | None = None,
         ordering: str | None = None,
+        page_size: int | None = None,
         **advanced_params: str | int | None,
     ):
         optional_params = {}
@@ -530,6 +825,7 @@ class Client(DeezerMixin, httpx.Client):
                 "q": " ".join(query_parts),
                 **optional_params,
             },
+            page_size=page_size,
         )
 
     def search(
@@ -545,6 +841,7 @@ class Client(DeezerMixin, httpx.Client):
         dur_max: int | None = None,
         bpm_min: int | None = None,
         bpm_max: int | None = None,
+        page_size: int | None = None,
     ):
         """
         Search tracks.
@@ -563,6 +860,7 @@ class Client(DeezerMixin, httpx.Client):
         :param dur_max: parameter for the advanced search feature.
         :param bpm_min: parameter for the advanced search feature.
         :param bpm_max: parameter for the advanced search feature.
+        :param page_size: the number of elements to fetch per request.
         :returns: a list of :class:`~deezer.Track` instances.
         """
         return self._search(
@@ -578,6 +876,7 @@ class Client(DeezerMixin, httpx.Client):
             dur_max=dur_max,
             bpm_min=bpm_min,
             bpm_max=bpm_max,
+            page_size=page_size,
         )
 
     def search_albums(
@@ -585,6 +884,7 @@ class Client(DeezerMixin, httpx.Client):
         query: str = "",
         strict: bool | None = None,
         ordering: str | None = None,
+        page_size: int | None = None,
     ) -> PaginatedList[Album]:
         """
         Search albums matching the given query.
@@ -592,6 +892,7 @@ class Client(DeezerMixin, httpx.Client):
         :param query: the query to search for, this is directly passed as q query.
         :param strict: whether to disable fuzzy search and enable strict mode.
         :param ordering: see Deezer API docs for possible values.
+        :param page_size: the number of elements to fetch per request.
         :return: list of :class:`~deezer.Album` instances.
         """
         return self._search(
@@ -599,6 +900,7 @@ class Client(DeezerMixin, httpx.Client):
             query=query,
             strict=strict,
             ordering=ordering,
+            page_size=page_size,
         )
 
     def search_artists(
@@ -606,6 +908,7 @@ class Client(DeezerMixin, httpx.Client):
         query: str = "",
         strict: bool | None = None,
         ordering: str | None = None,
+        page_size: int | None = None,
     ) -> PaginatedList[Artist]:
         """
         Search artists matching the given query.
@@ -613,6 +916,7 @@ class Client(DeezerMixin, httpx.Client):
         :param query: the query to search for, this is directly passed as q query.
         :param strict: whether to disable fuzzy search and enable strict mode.
         :param ordering: see Deezer API docs for possible values.
+        :param page_size: the number of elements to fetch per request.
         :return: list of :class:`~deezer.Album` instances.
         """
         return self._search(
@@ -620,6 +924,7 @@ class Client(DeezerMixin, httpx.Client):
             query=query,
             strict=strict,
             ordering=ordering,
+            page_size=page_size,
         )
 
     def search_playlists(
@@ -627,6 +932,7 @@ class Client(DeezerMixin, httpx.Client):
         query: str = "",
         strict: bool | None = None,
         ordering: str | None = None,
+        page_size: int | None = None,
     ) -> PaginatedList[Playlist]:
         """
         Search playlists matching the given query.
@@ -634,6 +940,7 @@ class Client(DeezerMixin, httpx.Client):
         :param query: the query to search for, this is directly passed as q query.
         :param strict: whether to disable fuzzy search and enable strict mode.
         :param ordering: see Deezer API docs for possible values.
+        :param page_size: the number of elements to fetch per request.
         :return: list of :class:`~deezer.Playlist` instances.
         """
         return self._search(
@@ -641,4 +948,5 @@ class Client(DeezerMixin, httpx.Client):
             query=query,
             strict=strict,
             ordering=ordering,
+            page_size=page_size,
         )
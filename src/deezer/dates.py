@@ -1,17 +1,30 @@
 from __future__ import annotations
 
 import datetime as dt
+from functools import lru_cache
 
 DATE_FORMAT = "%Y-%m-%d"
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Dates repeat a lot within a page, e.g. the release date of an album's tracks
+PARSE_CACHE_SIZE = 1024
 
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_date(date_str: str) -> dt.date | None:
     """Parse a date from a string to a date object."""
-    datetime = parse_datetime(date_str, DATE_FORMAT)
-    return datetime.date() if datetime else None
+    if not date_str or date_str.startswith("0000-00-00"):
+        return None
+    # fromisoformat is much faster, but accepts other shapes than the format, like week dates
+    if len(date_str) == len("YYYY-MM-DD") and date_str[4] == date_str[7] == "-" and date_str.isascii():
+        try:
+            return dt.date.fromisoformat(date_str)
+        except ValueError:
+            pass
+    return dt.datetime.strptime(date_str, DATE_FORMAT).date()
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_datetime(
     datetime_str: str,
     date_format: str = DATETIME_FORMAT,
@@ -19,4 +32,16 @@ def parse_datetime(
     """Parse a datetime from a string to a datetime object."""
     if not datetime_str or datetime_str.startswith("0000-00-00"):
         return None
+    if (
+        date_format == DATETIME_FORMAT
+        and len(datetime_str) == len("YYYY-MM-DD HH:MM:SS")
+        and datetime_str[4] == datetime_str[7] == "-"
+        and datetime_str[10] == " "
+        and datetime_str[13] == datetime_str[16] == ":"
+        and datetime_str.isascii()
+    ):
+        try:
+            return dt.datetime.fromisoformat(datetime_str)
+        except ValueError:
+            pass
     return dt.datetime.strptime(datetime_str, date_format)
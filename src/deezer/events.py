@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import re
+
+# Path segments identifying a resource, replaced in the endpoint templates
+ID_SEGMENT_RE = re.compile(r"^-?\d+$")
+CODE_SEGMENT_RE = re.compile(r"^(isrc|upc):.*$")
+
+
+def get_endpoint_template(path: str) -> str:
+    """
+    Get the template of the endpoint of a path, without the IDs.
+
+    For example ``artist/{id}/top`` for ``artist/27/top``, or
+    ``track/isrc:{isrc}`` for ``track/isrc:GBDUW0000059``.
+    """
+    segments = []
+    for segment in path.strip("/").split("/"):
+        if ID_SEGMENT_RE.match(segment):
+            segment = "{id}"
+        else:
+            segment = CODE_SEGMENT_RE.sub(r"\1:{\1}", segment)
+        segments.append(segment)
+    return "/".join(segments)
+
+
+class RequestEvent:
+    """
+    Details about a request made by a client, given to its observers.
+
+    An event is sent for each call to the ``request`` method of a client,
+    once the response is parsed or the request failed, whether the response
+    was served from the cache or fetched from the API, after any retries.
+
+    :ivar method: the HTTP method of the request.
+    :ivar path: the path of the request, e.g. ``artist/27/top``.
+    :ivar endpoint: the template of the path, e.g. ``artist/{id}/top``,
+                    to group the requests made to the same endpoint.
+    :ivar status_code: the HTTP status of the last response received, or
+                       ``None`` if no response was received for this request,
+                       when served from the cache for instance.
+    :ivar response_size: the size of the response content, in bytes.
+    :ivar cache_hit: whether the response was served from the cache.
+    :ivar retries: the number of times the request was retried.
+    :ivar network_time: the time spent sending the request and receiving the
+                        response, across retries, in seconds.
+    :ivar parse_time: the time spent decoding and parsing the response,
+                      in seconds.
+    :ivar error: the exception raised by the request, if it failed.
+    """
+
+    def __init__(self, method: str, path: str):
+        self.method = method.upper()
+        self.path = path
+        self.endpoint = get_endpoint_template(path)
+        self.status_code: int | None = None
+        self.response_size = 0
+        self.cache_hit = False
+        self.retries = 0
+        self.network_time = 0.0
+        self.parse_time = 0.0
+        self.error: Exception | None = None
+
+    def __repr__(self) -> str:
+        """Summary of the request."""
+        return f"<{self.__class__.__name__}: {self.method} {self.endpoint} {self.status_code}>"
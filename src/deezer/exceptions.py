@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from typing import Any
+
 import httpx
 
+QUOTA_EXCEEDED_ERROR_CODE = 4
+DATA_NOT_FOUND_ERROR_CODE = 800
+
 
 class DeezerAPIException(Exception):
     """Base exception for API errors."""
@@ -15,6 +20,7 @@ class DeezerHTTPError(DeezerAPIException):
     """Specialization wrapping HTTPError from the httpx library."""
 
     def __init__(self, http_exception: httpx.HTTPStatusError, *args: object) -> None:
+        self.response = http_exception.response
         if http_exception.response is not None and http_exception.response.text:
             url = http_exception.response.request.url
             status_code = http_exception.response.status_code
@@ -27,7 +33,7 @@ class DeezerHTTPError(DeezerAPIException):
     def from_http_error(cls, exc: httpx.HTTPStatusError) -> DeezerHTTPError:
         """Initialize the appropriate internal exception from a HTTPError."""
         if exc.response is not None:
-            if exc.response.status_code in {502, 503, 504}:
+            if exc.response.status_code in {429, 502, 503, 504}:
                 return DeezerRetryableHTTPError(exc)
             if exc.response.status_code == 403:
                 return DeezerForbiddenError(exc)
@@ -51,9 +57,21 @@ class DeezerNotFoundError(DeezerHTTPError):
 class DeezerErrorResponse(DeezerAPIException):
     """A functional error when the API doesn't accept the request."""
 
-    def __init__(self, json_data: dict[str, str]) -> None:
+    def __init__(self, json_data: dict[str, Any]) -> None:
         self.json_data = json_data
 
+    @classmethod
+    def from_json(cls, json_data: dict) -> DeezerErrorResponse:
+        """Initialize the appropriate internal exception from an error payload."""
+        error = json_data.get("error")
+        if isinstance(error, dict) and error.get("code") == QUOTA_EXCEEDED_ERROR_CODE:
+            return DeezerQuotaExceededError(json_data)
+        return DeezerErrorResponse(json_data)
+
+
+class DeezerQuotaExceededError(DeezerRetryableException, DeezerErrorResponse):
+    """The API rejected the request because too many requests were made."""
+
 
 class DeezerUnknownResource(DeezerAPIException):
     """The resource type couldn't be determined."""
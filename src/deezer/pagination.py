@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from collections.abc import Generator
-from typing import Generic, TypeVar, overload
+import itertools
+import math
+from collections.abc import Callable, Generator, Mapping, Sized
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Generic, TypeVar, overload
 from urllib.parse import parse_qs, urlparse
 
 import deezer
@@ -10,8 +14,86 @@ ResourceType = TypeVar("ResourceType")
 REPR_OUTPUT_SIZE = 5
 
 
+def get_next_index(next_url: str | None) -> int | None:
+    """Get the ``index`` query parameter from the URL of the next page."""
+    if not next_url:
+        return None
+    index_values = parse_qs(urlparse(next_url).query).get("index")
+    if not index_values:
+        return None
+    return int(index_values[0])
+
+
+def get_base_params(params: dict | None, page_size: int | None) -> dict:
+    """
+    Get the query parameters shared by all the pages of a list.
+
+    The page size is sent as the ``limit`` parameter, unless it's
+    already given in the parameters.
+    """
+    base_params = dict(params or {})
+    if page_size is not None:
+        base_params.setdefault("limit", page_size)
+    return base_params
+
+
+def locate_element(
+    pages: Mapping[int, Sized],
+    page_size: int | None,
+    last_page: int | None,
+    index: int,
+) -> tuple[int, int] | None:
+    """
+    Find the page holding the element at the given index, from the pages fetched so far.
+
+    Deezer may return fewer elements than the page size, while the next
+    page still starts a full page further. The pages already fetched are
+    counted with their actual number of elements, the other ones are
+    assumed to be full, to go straight to the page needed.
+
+    :returns: a tuple with the page number, which may not be fetched yet,
+              and the offset in that page, or ``None`` if the list doesn't
+              have that many elements.
+    """
+    page_number = 0
+    offset = index
+    for known_page_number in sorted(pages):
+        if known_page_number > page_number:
+            skipped_elements = (known_page_number - page_number) * (page_size or 0)
+            if offset < skipped_elements:
+                break
+            offset -= skipped_elements
+            page_number = known_page_number
+        page = pages[known_page_number]
+        if offset < len(page):
+            return page_number, offset
+        if not page or (last_page is not None and page_number >= last_page):
+            return None
+        offset -= len(page)
+        page_number += 1
+    if page_size:
+        page_number += offset // page_size
+        offset %= page_size
+    if last_page is not None and page_number > last_page:
+        return None
+    return page_number, offset
+
+
 class PaginatedList(Generic[ResourceType]):
-    """Abstract paginated response from the API and make them more Pythonic."""
+    """
+    Abstract paginated response from the API and make them more Pythonic.
+
+    :param page_size: the number of elements to fetch per request, sent as
+                      the ``limit`` parameter. Defaults to the ``page_size``
+                      of the client, or to the API default if not set.
+    :param read_ahead: the number of pages to fetch in the background while
+                       iterating, ahead of the page being consumed. Disabled
+                       by default. It may also be changed later, through the
+                       ``read_ahead`` attribute.
+    :param use_cache: whether the pages may be served from the cache of the
+                      client. Disable it to get the latest version of a list
+                      which may have changed.
+    """
 
     # Lifted and adapted from PyGithub:
     # https://github.com/PyGithub/PyGithub/blob/master/github/PaginatedList.py
@@ -22,15 +104,22 @@ class PaginatedList(Generic[ResourceType]):
         base_path: str,
         parent: deezer.Resource | None = None,
         params: dict | None = None,
+        page_size: int | None = None,
+        read_ahead: int = 0,
+        use_cache: bool = True,
     ):
-        self.__elements: list[ResourceType] = []
+        self.read_ahead = read_ahead
+        self.use_cache = use_cache
         self.__client = client
         self.__base_path = base_path
-        self.__base_params = params or {}
-        self.__next_path: str | None = base_path
-        self.__next_params = params or {}
+        self.__base_params = get_base_params(params, page_size or client.page_size)
+        self.__start_index = int(self.__base_params.get("index", 0))
         self.__parent = parent
+        self.__pages: dict[int, list[ResourceType]] = {}
+        self.__page_size: int | None = None
+        self.__last_page: int | None = None
         self.__total = None
+        self.__read_ahead_futures: dict[int, Future[dict[str, Any]]] = {}
         self.__iter = iter(self)
 
     def __repr__(self) -> str:
@@ -53,20 +142,23 @@ class PaginatedList(Generic[ResourceType]):
     ) -> ResourceType | list[ResourceType]:
         """Get an item or a slice of items from the list."""
         if isinstance(index, int):
-            self._fetch_to_index(index)
-            return self.__elements[index]
-        if index.stop is not None:
-            self._fetch_to_index(index.stop)
-        else:
-            while self._could_grow():
-                self._grow()
-        return self.__elements[index]
+            if index < 0:
+                raise IndexError(f"Negative indexing is not supported: {index}")
+            location = self._locate(index)
+            if location is None:
+                raise IndexError(f"list index out of range: {index}")
+            page_number, offset = location
+            return self._get_page(page_number)[offset]
+        if any(value is not None and value < 0 for value in (index.start, index.stop, index.step)):
+            return list(self)[index]
+        start = index.start or 0
+        stop = None if index.stop is None else max(index.stop - start, 0)
+        return list(itertools.islice(self._iter_from(start), 0, stop, index.step))
 
     def __iter__(self) -> Generator[ResourceType, None, None]:
-        """Iterate over the internal, fetching new pages as needed."""
-        yield from self.__elements
-        while self._could_grow():
-            yield from self._grow()
+        """Iterate over the elements, fetching new pages as needed."""
+        with self._reading_ahead() as read_ahead:
+            yield from self._iter_from(0, read_ahead)
 
     def __next__(self) -> ResourceType:
         """Get the next item from the list."""
@@ -76,49 +168,196 @@ class PaginatedList(Generic[ResourceType]):
         """Get the total number of items across all pages."""
         return self.total
 
-    def _could_grow(self) -> bool:
-        return self.__next_path is not None
+    def prefetch(self, max_workers: int = 4) -> None:
+        """
+        Fetch all the remaining pages concurrently.
+
+        Once the first page is fetched, the total number of items is known,
+        so the offsets of the other pages can be computed and the pages
+        fetched in parallel, using a pool of threads. The pages are then
+        available to iterate over the list without further API calls.
+
+        :param max_workers: the maximum number of pages fetched at once.
+        """
+        self._get_page(0)
+        missing_pages = [
+            page_number for page_number in range(1, self._get_page_count()) if page_number not in self.__pages
+        ]
+        if not missing_pages:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            payloads = executor.map(self._fetch_page, missing_pages)
+            for page_number, response_payload in zip(missing_pages, payloads, strict=True):
+                self._store_page(page_number, response_payload)
+
+    def iter_pages(self) -> Generator[list[ResourceType], None, None]:
+        """
+        Iterate over the pages, without keeping them in the list.
+
+        Unlike iterating over the list, the pages fetched along the way
+        are handed over and not kept, so going through a very long list
+        uses a constant amount of memory. Iterating again will fetch the
+        pages again, apart from the ones already kept by the list.
+        """
+        with self._reading_ahead() as read_ahead:
+            for page_number in itertools.count():
+                read_ahead(page_number)
+                if page_number in self.__pages:
+                    page = self.__pages[page_number]
+                else:
+                    page = self._read_page(page_number, self._get_page_payload(page_number))
+                yield page
+                if not page or self._is_last_page(page_number):
+                    return
+
+    def stream(self) -> Generator[ResourceType, None, None]:
+        """
+        Iterate over the elements, without keeping them in the list.
+
+        See :meth:`iter_pages` for details.
+        """
+        for page in self.iter_pages():
+            yield from page
+
+    def _iter_from(
+        self,
+        index: int,
+        read_ahead: Callable[[int], None] | None = None,
+    ) -> Generator[ResourceType, None, None]:
+        """
+        Iterate over the elements, starting from the given index.
+
+        :param read_ahead: a function called with the number of each page
+                           before it's consumed, see :meth:`_reading_ahead`.
+        """
+        location = self._locate(index)
+        if location is None:
+            return
+        page_number, offset = location
+        while True:
+            if read_ahead is not None:
+                read_ahead(page_number)
+            page = self._get_page(page_number)
+            yield from page[offset:]
+            if not page or self._is_last_page(page_number):
+                return
+            page_number += 1
+            offset = 0
+
+    @contextmanager
+    def _reading_ahead(self) -> Generator[Callable[[int], None], None, None]:
+        """
+        Fetch the pages following the one being consumed in a worker thread.
+
+        Yields a function to call with the number of the page about to be
+        consumed, to start fetching the next ``read_ahead`` pages. Pages
+        which weren't started when leaving the context are cancelled.
+        """
+        if not self.read_ahead:
+            yield lambda page_number: None
+            return
+        executor = ThreadPoolExecutor(max_workers=self.read_ahead)
+
+        def read_ahead(page_number: int) -> None:
+            last_page_number = min(page_number + self.read_ahead, self._get_page_count() - 1)
+            for next_page_number in range(page_number + 1, last_page_number + 1):
+                if next_page_number not in self.__pages and next_page_number not in self.__read_ahead_futures:
+                    future = executor.submit(self._fetch_page, next_page_number)
+                    self.__read_ahead_futures[next_page_number] = future
+
+        try:
+            yield read_ahead
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            for page_number, future in list(self.__read_ahead_futures.items()):
+                if future.cancelled() or (future.done() and future.exception() is not None):
+                    del self.__read_ahead_futures[page_number]
+
+    def _locate(self, index: int) -> tuple[int, int] | None:
+        """
+        Find the page containing the element at the given index.
+
+        The first page is fetched if needed, to know the page size. The page
+        expected to contain the element is fetched next, and the following
+        ones if it turns out to be short, see :func:`locate_element`.
+
+        :returns: a tuple with the page number and the offset in that page,
+                  or ``None`` if the list doesn't have that many elements.
+        """
+        self._get_page(0)
+        while True:
+            location = locate_element(self.__pages, self.__page_size, self.__last_page, index)
+            if location is None or location[0] in self.__pages:
+                return location
+            self._get_page(location[0])
 
-    def _grow(self) -> list[ResourceType]:
-        new_elements = self._fetch_next_page()
-        self.__elements.extend(new_elements)
-        return new_elements
+    def _get_page_count(self) -> int:
+        """The number of pages, as far as we know from the total."""
+        if self.__last_page is not None:
+            return self.__last_page + 1
+        if not self.__total or not self.__page_size:
+            return len(self.__pages)
+        return math.ceil((self.__total - self.__start_index) / self.__page_size)
 
-    def _fetch_next_page(self) -> list[ResourceType]:
-        assert self.__next_path is not None  # noqa S101
-        response_payload = self.__client.request(
+    def _is_last_page(self, page_number: int) -> bool:
+        return self.__last_page is not None and page_number >= self.__last_page
+
+    def _get_page(self, page_number: int) -> list[ResourceType]:
+        """Get the elements of the given page, fetching it if needed."""
+        if page_number not in self.__pages:
+            self._store_page(page_number, self._get_page_payload(page_number))
+        return self.__pages[page_number]
+
+    def _get_page_payload(self, page_number: int) -> dict[str, Any]:
+        """Get the response for the given page, from the read-ahead if available."""
+        future = self.__read_ahead_futures.pop(page_number, None)
+        if future is not None:
+            return future.result()
+        return self._fetch_page(page_number)
+
+    def _get_page_params(self, page_number: int) -> dict[str, Any]:
+        params = self.__base_params.copy()
+        if page_number > 0:
+            assert self.__page_size is not None  # noqa S101
+            params["index"] = self.__start_index + page_number * self.__page_size
+        return params
+
+    def _fetch_page(self, page_number: int) -> dict[str, Any]:
+        return self.__client.request(
             "GET",
-            self.__next_path,
+            self.__base_path,
             parent=self.__parent,
             paginate_list=True,
-            params=self.__next_params,
+            params=self._get_page_params(page_number),
+            use_cache=self.use_cache,
         )
-        self.__next_path = None
+
+    def _store_page(self, page_number: int, response_payload: dict[str, Any]) -> None:
+        self.__pages[page_number] = self._read_page(page_number, response_payload)
+
+    def _read_page(self, page_number: int, response_payload: dict[str, Any]) -> list[ResourceType]:
+        """Update what we know about the list from a page, and get its elements."""
+        elements = response_payload["data"]
         self.__total = response_payload.get("total")
         next_url = response_payload.get("next", None)
-        if next_url:
-            url_bits = urlparse(next_url)
-            self.__next_path = url_bits.path.lstrip("/")
-            self.__next_params = parse_qs(url_bits.query)
-        return response_payload["data"]
-
-    def _fetch_to_index(self, index: int):
-        while len(self.__elements) <= index and self._could_grow():
-            self._grow()
+        if self.__page_size is None:
+            # Deezer's default page size depends on the endpoint, but
+            # the first page tells us where the second one starts
+            next_index = get_next_index(next_url)
+            self.__page_size = next_index - self.__start_index if next_index is not None else len(elements)
+        if not next_url and (self.__last_page is None or page_number < self.__last_page):
+            self.__last_page = page_number
+        return elements
 
     @property
     def total(self) -> int:
-        """The total number of items in the list, mirroring what Deezer returns."""
+        """
+        The total number of items in the list, mirroring what Deezer returns.
+
+        If no page was fetched yet, the first page is fetched and kept, to be
+        reused when accessing the elements.
+        """
         if self.__total is None:
-            params = self.__base_params.copy()
-            params["limit"] = 1
-            response_payload = self.__client.request(
-                "GET",
-                self.__base_path,
-                parent=self.__parent,
-                paginate_list=True,
-                params=params,
-            )
-            self.__total = response_payload["total"]
+            self._get_page(0)
         assert self.__total is not None  # noqa S101
         return self.__total
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+
+DEFAULT_MAX_CALLS = 50
+DEFAULT_PERIOD = 5.0
+
+
+class RateLimiter:
+    """
+    Pace the requests to stay within the quota of the Deezer API.
+
+    Deezer allows 50 requests every 5 seconds, and rejects the requests
+    above the quota with an error. The limiter keeps track of the time slots
+    of the last requests, and delays the next one until sending it wouldn't
+    exceed the quota over any window of ``period`` seconds.
+
+        >>> import deezer
+        >>> from deezer.ratelimit import RateLimiter
+        >>> client = deezer.Client(rate_limiter=RateLimiter())
+
+    The same instance may be shared between several clients, for example
+    if they are using the same access token.
+
+    :param max_calls: the maximum number of requests per period.
+    :param period: the duration of the period, in seconds.
+    """
+
+    def __init__(
+        self,
+        max_calls: int = DEFAULT_MAX_CALLS,
+        period: float = DEFAULT_PERIOD,
+    ):
+        self.max_calls = max_calls
+        self.period = period
+        self._slots: deque[float] = deque(maxlen=max_calls)
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Reserve a time slot for the next request.
+
+        :returns: the delay to wait before sending the request, in seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = now
+            if len(self._slots) == self.max_calls:
+                slot = max(now, self._slots[0] + self.period)
+            self._slots.append(slot)
+        return slot - now
+
+    def acquire(self) -> None:
+        """Block until the next request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def async_acquire(self) -> None:
+        """Wait until the next request may be sent, without blocking the event loop."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
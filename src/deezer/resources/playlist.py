@@ -3,7 +3,7 @@ from __future__ import annotations
 from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
-from ..utils import gen_ids
+from ..utils import MAX_IDS_PER_REQUEST, diff_ids, gen_ids, gen_ids_chunks
 from .resource import Resource
 
 if TYPE_CHECKING:
@@ -67,27 +67,74 @@ class Playlist(Resource):
         """
         return self.client.request("POST", f"playlist/{self.id}/seen")
 
-    def add_tracks(self, tracks: Iterable[int | Track]) -> bool:
+    def add_tracks(self, tracks: Iterable[int | Track], chunk_size: int = MAX_IDS_PER_REQUEST) -> bool:
         """
         Add tracks to a playlist.
 
+        Many tracks are added in chunks, one request after the other to
+        keep their order, as a single request can't hold them all.
+
         :param tracks: An iterable of :class:`Track <deezer.Track>` instances
                        or their IDs to add to the playlist
+        :param chunk_size: the maximum number of tracks added per request.
         :returns: a boolean that tells if the operation was successful
         """
-        track_ids_str = ",".join(str(tid) for tid in gen_ids(tracks))
-        return self.client.request("POST", f"playlist/{self.id}/tracks", params={"songs": track_ids_str})
+        return self._update_tracks("POST", tracks, chunk_size)
 
-    def delete_tracks(self, tracks: Iterable[int | Track]) -> bool:
+    def delete_tracks(self, tracks: Iterable[int | Track], chunk_size: int = MAX_IDS_PER_REQUEST) -> bool:
         """
         Delete tracks from a playlist.
 
+        Many tracks are deleted in chunks, see :meth:`add_tracks`.
+
         :param tracks: An iterable of :class:`Track <deezer.Track>` instances
                        or their IDs to remove from the playlist.
+        :param chunk_size: the maximum number of tracks deleted per request.
+        :returns: a boolean that tells if the operation was successful
+        """
+        return self._update_tracks("DELETE", tracks, chunk_size)
+
+    def _update_tracks(self, method: str, tracks: Iterable[int | Track], chunk_size: int) -> bool:
+        """Add or delete tracks, in chunks, and tell whether all the chunks were successful."""
+        results = [
+            self.client.request(method, f"playlist/{self.id}/tracks", params={"songs": track_ids_str})
+            for track_ids_str in gen_ids_chunks(tracks, chunk_size)
+        ]
+        return all(results)
+
+    def sync_tracks(self, tracks: Iterable[int | Track]) -> bool:
+        """
+        Update the playlist to have the given tracks, in the given order.
+
+        The current tracks are fetched and compared to the given ones, to
+        only delete the tracks not wanted anymore, add the missing ones,
+        and reorder the tracks if they aren't in the right order.
+        Nothing is sent when the playlist is already up to date. The tracks
+        present more than once in the playlist are deleted, and added again
+        if wanted, as deleting a track deletes all its occurrences.
+
+        Reordering sends all the tracks in a single request, so it's only
+        possible when they fit in one, like a chunk of :meth:`add_tracks`.
+        For longer playlists, the tracks from the first one out of place are
+        deleted and added again in order instead, which changes the date
+        they were added to the playlist.
+
+        :param tracks: An iterable of :class:`Track <deezer.Track>` instances
+                       or their IDs, in the wished order.
         :returns: a boolean that tells if the operation was successful
         """
-        track_ids_str = ",".join(map(str, gen_ids(tracks)))
-        return self.client.request("DELETE", f"playlist/{self.id}/tracks", params={"songs": track_ids_str})
+        wanted_ids = list(dict.fromkeys(gen_ids(tracks)))
+        current_ids = [track.id for track in self.get_tracks().stream()]
+        can_reorder = len(list(gen_ids_chunks(wanted_ids))) <= 1
+        removed_ids, added_ids, reorder = diff_ids(current_ids, wanted_ids, can_reorder)
+        results = []
+        if removed_ids:
+            results.append(self.delete_tracks(removed_ids))
+        if added_ids:
+            results.append(self.add_tracks(added_ids))
+        if reorder:
+            results.append(self.reorder_tracks(wanted_ids))
+        return all(results)
 
     def reorder_tracks(self, order: Iterable[int | Track]) -> bool:
         """
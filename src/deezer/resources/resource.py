@@ -1,14 +1,90 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Any
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from typing import Any, ClassVar
 
 from ..pagination import PaginatedList
 
 NOT_INFERRED = object()
+PARSE_HOOK_PREFIX = "_parse_"
 
+# Maximum number of distinct tuples of field names shared between resources
+FIELDS_TUPLES_CACHE_SIZE = 1024
 
-class Resource:
+
+@lru_cache(maxsize=FIELDS_TUPLES_CACHE_SIZE)
+def _intern_fields(fields: tuple[str, ...]) -> tuple[str, ...]:
+    return fields
+
+
+def get_fields_tuple(field_names: Iterable[str]) -> tuple[str, ...]:
+    """
+    Get a tuple of the given field names, shared with the other resources having the same fields.
+
+    Resources built from the same endpoint have the same fields. Only the
+    most recently used tuples are kept, so unusual responses don't make
+    the shared tuples grow forever.
+    """
+    return _intern_fields(tuple(field_names))
+
+
+def get_field_parsers(cls: type) -> dict[str, Callable[[Any, Any], Any]]:
+    """
+    Collect the parse hooks of a resource class, by field name.
+
+    A hook is a ``_parse_<field name>`` method, or static method, converting
+    the raw value of the field. They are all returned as functions taking
+    the resource and the raw value.
+    """
+    field_parsers = {}
+    for klass in reversed(cls.__mro__):
+        for attr_name, attr_value in vars(klass).items():
+            if not attr_name.startswith(PARSE_HOOK_PREFIX):
+                continue
+            field_name = attr_name.removeprefix(PARSE_HOOK_PREFIX)
+            if isinstance(attr_value, staticmethod):
+                func = attr_value.__func__
+                field_parsers[field_name] = lambda resource, value, func=func: func(value)
+            elif callable(attr_value):
+                field_parsers[field_name] = attr_value
+    return field_parsers
+
+
+class ResourceMeta(type):
+    """
+    Metaclass storing the fields declared on resources in slots.
+
+    The fields annotated on a resource class are stored in slots, rather
+    than in a dictionary for each instance, which takes much less memory
+    when holding many resources. The fields returned by the API but not
+    declared on the class are stored in the instance ``__dict__``, only
+    created when needed.
+
+    The parse hooks of the class are also collected once, when the class
+    is created, in its ``_field_parsers`` mapping.
+    """
+
+    _field_parsers: dict[str, Callable[[Any, Any], Any]]
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        """Create the class, with slots for the annotated fields not defined in the parents."""
+        if "__slots__" not in namespace:
+            inherited_slots = {
+                slot for base in bases for klass in base.__mro__ for slot in getattr(klass, "__slots__", ())
+            }
+            namespace["__slots__"] = tuple(
+                field_name
+                for field_name in namespace.get("__annotations__", {})
+                if field_name not in inherited_slots and field_name not in namespace
+            )
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        cls._field_parsers = get_field_parsers(cls)
+        return cls
+
+
+class Resource(metaclass=ResourceMeta):
     """
     Base class for any resource.
 
@@ -17,22 +93,107 @@ class Resource:
     attributes
     """
 
+    __slots__ = ("__dict__", "__weakref__", "_fetched", "_fields", "_parent", "_raw", "client", "id", "type")
+
     id: int
     type: str
 
     _fields: tuple[str, ...]
     _fetched: bool
+    _raw: dict[str, Any] | None
+    _parent: Resource | None
+    _field_parsers: ClassVar[dict[str, Callable[[Any, Any], Any]]]
 
     def __init__(self, client, json):
         self.client = client
-        for field_name in json.keys():
-            parse_func = getattr(self, f"_parse_{field_name}", None)
-            if callable(parse_func):
-                json[field_name] = parse_func(json[field_name])
-        self._fields = tuple(json.keys())
+        self._raw = None
+        self._parent = None
+        self._fields = ()
+        self._set_fields(json)
+
+    def _set_fields(self, json: dict[str, Any]) -> None:
+        """Set the fields from the API response, and add them to the known fields."""
+        if self._fields:
+            field_names = (*self._fields, *(key for key in json if key not in self._fields))
+        else:
+            field_names = tuple(json)
+        if getattr(self.client, "lazy_parsing", False):
+            raw = {key: json.pop(key) for key in list(json) if self._needs_parsing(key, json[key])}
+            if raw:
+                self._raw = {**self._raw, **raw} if self._raw else raw
+        else:
+            for field_name, parse_func in self._field_parsers.items():
+                if field_name in json:
+                    json[field_name] = parse_func(self, json[field_name])
+        self._fields = get_fields_tuple(field_names)
         for key in json:
             setattr(self, key, json[key])
 
+    def _merge_fields(self, json: dict[str, Any]) -> None:
+        """Update the fields from another response for the same resource, keeping the other ones."""
+        if self._raw:
+            for key in json:
+                self._raw.pop(key, None)
+            self._raw = self._raw or None
+        field_names = list(json)
+        self._set_fields(json)
+        if self._raw:
+            # The fields kept raw again mustn't be hidden by their previous value
+            for field_name in field_names:
+                if field_name in self._raw:
+                    try:
+                        object.__delattr__(self, field_name)
+                    except AttributeError:
+                        pass
+
+    def _update_from(self, full_resource: Resource) -> None:
+        """Add the fields of the full resource, fetched from the API, which this one doesn't have."""
+        self._fetched = True
+        if full_resource is self:
+            return
+        missing_fields = [field_name for field_name in full_resource._fields if field_name not in self._fields]
+        for field_name in missing_fields:
+            setattr(self, field_name, getattr(full_resource, field_name))
+        self._fields = get_fields_tuple((*self._fields, *missing_fields))
+
+    def _needs_parsing(self, field_name: str, value: Any) -> bool:
+        """Whether the raw value of a field needs to be converted."""
+        return field_name in self._field_parsers or self.client._is_nested_json(value)
+
+    def _convert_raw_field(self, field_name: str) -> Any:
+        """Convert the raw value of a field kept for lazy parsing, and set it."""
+        assert self._raw is not None  # noqa S101
+        value = self._raw.pop(field_name)
+        if not self._raw:
+            self._raw = None
+        if self.client._is_nested_json(value):
+            value = self.client._process_json(value, self._parent)
+        parse_func = self._field_parsers.get(field_name)
+        if parse_func is not None:
+            value = parse_func(self, value)
+        setattr(self, field_name, value)
+        return value
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Get the state of the resource, to copy or pickle it.
+
+        Only the attributes already set are collected, without going
+        through :meth:`__getattr__`, which would fetch the missing fields.
+        """
+        state = dict(self.__dict__)
+        for name in ("client", "_fields", "_raw", "_parent", "_fetched", *self._fields):
+            try:
+                state[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state of a copied or unpickled resource."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
     def __repr__(self):
         """Convenient representation giving a preview of the item."""
         name = getattr(self, "name", None)
@@ -109,6 +270,8 @@ class Resource:
         self,
         relation: str,
         params: dict | None = None,
+        page_size: int | None = None,
+        use_cache: bool = True,
     ) -> PaginatedList:
         """Build the pagination object based on the relation."""
         return PaginatedList(
@@ -116,6 +279,8 @@ class Resource:
             base_path=f"{self.type}/{self.id}/{relation}",
             parent=self,
             params=params,
+            page_size=page_size,
+            use_cache=use_cache,
         )
 
     def __getattr__(self, item: str) -> Any:
@@ -125,19 +290,17 @@ class Resource:
         This is a fallback method, not need to call the parent implementation.
         If the attribute is found through the normal mechanism, this is NOT called.
         """
+        if item != "_raw" and self._raw and item in self._raw:
+            return self._convert_raw_field(item)
         class_annotations = self.__class__.__annotations__
-        if item in class_annotations:
+        if item in class_annotations and not item.startswith("_"):
             result = self._infer_missing_field(item)
             if result is not NOT_INFERRED:
                 setattr(self, item, result)
                 self._fields += (item,)
                 return result
             elif not getattr(self, "_fetched", False):
-                full_resource = self.get()
-                missing_fields = set(full_resource._fields) - set(self._fields)
-                for field_name in missing_fields:
-                    setattr(self, field_name, getattr(full_resource, field_name))
-                    self._fields += (field_name,)
+                self._update_from(self.get())
                 return getattr(self, item)
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{item}'")
 
@@ -49,7 +49,7 @@ class Track(Resource):
     _parse_release_date = staticmethod(parse_date)
 
     def _parse_contributors(self, raw_value):
-        return [Artist(client=self.client, json=val) for val in raw_value]
+        return [self.client._build_resource(Artist, val) for val in raw_value]
 
     def get_artist(self) -> Artist:
         """
@@ -48,14 +48,14 @@ class User(Resource):
     _parse_birthday = staticmethod(parse_date)
     _parse_inscription_date = staticmethod(parse_date)
 
-    def get_albums(self, **params) -> PaginatedList[Album]:
+    def get_albums(self, page_size: int | None = None, **params) -> PaginatedList[Album]:
         """
         Get user's favorite albums.
 
         :returns: a :class:`PaginatedList <deezer.PaginatedList>`
                   of :class:`Album <deezer.Album>` instances
         """
-        return self.get_paginated_list("albums", params=params)
+        return self.get_paginated_list("albums", params=params, page_size=page_size)
 
     def add_album(self, album: Album | int):
         """
@@ -82,7 +82,7 @@ class User(Resource):
         :returns: a :class:`PaginatedList <deezer.PaginatedList>`
                   of :class:`Track <deezer.Track>` instances
         """
-        return self.get_paginated_list("tracks")
+        return self.get_paginated_list("tracks", **kwargs)
 
     def add_track(self, track: Track | int):
         """
@@ -102,14 +102,14 @@ class User(Resource):
         """
         return self.delete_relation("tracks", params={"track_id": get_id(track)})
 
-    def get_artists(self, **params) -> PaginatedList[Artist]:
+    def get_artists(self, page_size: int | None = None, **params) -> PaginatedList[Artist]:
         """
         Get user's favorite artists.
 
         :returns: a :class:`PaginatedList <deezer.PaginatedList>`
                   of :class:`Artist <deezer.Artist>` instances
         """
-        return self.get_paginated_list("artists", params=params)
+        return self.get_paginated_list("artists", params=params, page_size=page_size)
 
     def add_artist(self, artist: Artist | int):
         """
@@ -129,23 +129,23 @@ class User(Resource):
         """
         return self.delete_relation("artists", params={"artist_id": get_id(artist)})
 
-    def get_followers(self, **params) -> PaginatedList[User]:
+    def get_followers(self, page_size: int | None = None, **params) -> PaginatedList[User]:
         """
         Get user's followers.
 
         :returns: a :class:`PaginatedList <deezer.PaginatedList>`
                   of :class:`User <deezer.User>` instances
         """
-        return self.get_paginated_list("followers", params=params)
+        return self.get_paginated_list("followers", params=params, page_size=page_size)
 
-    def get_followings(self, **params) -> PaginatedList[User]:
+    def get_followings(self, page_size: int | None = None, **params) -> PaginatedList[User]:
         """
         Get user's followings.
 
         :returns: a :class:`PaginatedList <deezer.PaginatedList>`
                   of :class:`User <deezer.User>` instances
         """
-        return self.get_paginated_list("followings", params=params)
+        return self.get_paginated_list("followings", params=params, page_size=page_size)
 
     def follow(self, user: User | int):
         """
@@ -165,14 +165,14 @@ class User(Resource):
         """
         return self.delete_relation("followings", params={"user_id": get_id(user)})
 
-    def get_playlists(self, **params) -> PaginatedList[Playlist]:
+    def get_playlists(self, page_size: int | None = None, **params) -> PaginatedList[Playlist]:
         """
         Get user's public playlists.
 
         :returns: a :class:`PaginatedList <deezer.PaginatedList>`
                   of :class:`Playlist <deezer.Playlist>` instances
         """
-        return self.get_paginated_list("playlists", params=params)
+        return self.get_paginated_list("playlists", params=params, page_size=page_size)
 
     def add_playlist(self, playlist: Playlist | int):
         """
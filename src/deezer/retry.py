@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import datetime as dt
+import random
+from collections.abc import Collection
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from deezer.exceptions import (
+    DeezerHTTPError,
+    DeezerQuotaExceededError,
+    DeezerRetryableException,
+)
+
+
+class Retry:
+    """
+    Policy to retry the requests failing with a temporary error.
+
+    The requests are retried on network errors, on HTTP errors which
+    might be temporary (429, 502, 503 and 504 status codes), and when the
+    API reports that the quota is exceeded. The delay between attempts grows
+    exponentially, capped to ``backoff_max``, with a random jitter to avoid
+    many clients retrying all at once. When the server sends a
+    ``Retry-After`` header, it's used as delay instead.
+
+        >>> import deezer
+        >>> from deezer.retry import Retry
+        >>> client = deezer.Client(retry=Retry(total=5))
+
+    :param total: the maximum number of retries for a request.
+    :param backoff_factor: the base delay between attempts, in seconds.
+    :param backoff_max: the maximum delay between attempts, in seconds.
+    :param jitter: whether to randomize the delay between attempts.
+    :param methods: the HTTP methods to retry on network and HTTP errors.
+                    Requests rejected due to the quota are retried
+                    regardless of their method, as they weren't processed.
+    """
+
+    def __init__(
+        self,
+        total: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: bool = True,
+        methods: Collection[str] = ("GET",),
+    ):
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.methods = {method.upper() for method in methods}
+
+    def is_retryable(self, method: str, exc: Exception) -> bool:
+        """Whether the request failing with the given exception may be retried."""
+        if isinstance(exc, DeezerQuotaExceededError):
+            return True
+        if method.upper() not in self.methods:
+            return False
+        return isinstance(exc, (httpx.TransportError, DeezerRetryableException))
+
+    def get_backoff(self, attempt: int) -> float:
+        """Get the delay before the given retry attempt, starting from 0."""
+        delay = min(self.backoff_max, self.backoff_factor * 2**attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)  # noqa: S311
+        return delay
+
+    def get_delay(self, method: str, exc: Exception, attempt: int) -> float | None:
+        """
+        Get the delay before retrying a failed request.
+
+        :param method: the HTTP method of the request.
+        :param exc: the exception raised by the request.
+        :param attempt: the number of retries already made.
+        :returns: the delay in seconds, or ``None`` if it shouldn't be retried.
+        """
+        if attempt >= self.total or not self.is_retryable(method, exc):
+            return None
+        if isinstance(exc, DeezerHTTPError) and exc.response is not None:
+            retry_after = parse_retry_after(exc.response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+        return self.get_backoff(attempt)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse the value of a ``Retry-After`` header to a delay in seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=dt.timezone.utc)
+    return max(0.0, (retry_at - dt.datetime.now(dt.timezone.utc)).total_seconds())
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import Generator, Iterable
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from deezer import Resource
 
+# Keep the list of IDs sent in a query string well below the usual URL limits
+MAX_IDS_PER_REQUEST = 500
+MAX_IDS_LENGTH = 4000
+
 
 def gen_ids(item_list: Iterable[int | Resource]) -> Generator[int, None, None]:
     """Get IDs for an iterable of `int` or `Resources`."""
@@ -20,3 +25,63 @@ def get_id(item: int | Resource) -> int:
     if hasattr(item, "id"):
         return item.id
     raise NotImplementedError(f"Unknown type for {item}")
+
+
+def gen_ids_chunks(
+    item_list: Iterable[int | Resource],
+    chunk_size: int = MAX_IDS_PER_REQUEST,
+    max_length: int = MAX_IDS_LENGTH,
+) -> Generator[str, None, None]:
+    """
+    Get comma separated IDs for an iterable of `int` or `Resources`, in chunks.
+
+    Each chunk has at most ``chunk_size`` IDs, and at most ``max_length``
+    characters, to fit in the query string of a request.
+    """
+    chunk: list[str] = []
+    length = 0
+    for item_id in gen_ids(item_list):
+        id_str = str(item_id)
+        if chunk and (len(chunk) >= chunk_size or length + 1 + len(id_str) > max_length):
+            yield ",".join(chunk)
+            chunk = []
+            length = 0
+        length += len(id_str) + (1 if chunk else 0)
+        chunk.append(id_str)
+    if chunk:
+        yield ",".join(chunk)
+
+
+def diff_ids(
+    current_ids: Iterable[int],
+    wanted_ids: list[int],
+    can_reorder: bool = True,
+) -> tuple[list[int], list[int], bool]:
+    """
+    Compare an ordered list of IDs with the wanted one, without duplicates.
+
+    The IDs missing from the current list would be added at its end.
+    Removing an ID removes all its occurrences, so the IDs present more
+    than once in the current list are removed, and added again if wanted.
+
+    :param can_reorder: whether the list may be reordered afterwards. If not,
+                        the IDs from the first one out of place are removed
+                        and added again, in the wanted order.
+    :returns: a tuple with the IDs to remove, the IDs to add, and whether
+              the list needs to be reordered afterwards.
+    """
+    counts = Counter(current_ids)
+    wanted_ids_set = set(wanted_ids)
+    removed_ids = [item_id for item_id, count in counts.items() if count > 1 or item_id not in wanted_ids_set]
+    kept_ids = [item_id for item_id, count in counts.items() if count == 1 and item_id in wanted_ids_set]
+    if not can_reorder:
+        in_place = 0
+        for kept_id, wanted_id in zip(kept_ids, wanted_ids, strict=False):
+            if kept_id != wanted_id:
+                break
+            in_place += 1
+        removed_ids += kept_ids[in_place:]
+        kept_ids = kept_ids[:in_place]
+    kept_ids_set = set(kept_ids)
+    added_ids = [item_id for item_id in wanted_ids if item_id not in kept_ids_set]
+    return removed_ids, added_ids, kept_ids + added_ids != wanted_ids
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pytest
+
+from deezer.asyncio import AsyncClient
+from deezer.cache import MemoryCache
+from deezer.changes import PlaylistChangeTracker
+
+pytestmark = pytest.mark.vcr
+
+
+class TestPlaylistChangeTracker:
+    @pytest.mark.asyncio
+    async def test_async_get_tracks_if_changed(self, async_client):
+        tracker = PlaylistChangeTracker()
+        tracks = await tracker.async_get_tracks_if_changed(async_client, 908622995)
+        assert tracks is not None
+        assert [track.id async for track in tracks] == [3135556, 1425844092]
+        assert await tracker.async_get_tracks_if_changed(async_client, 908622995) is None
+        tracks = await tracker.async_get_tracks_if_changed(async_client, 908622995)
+        assert tracks is not None
+        assert len(tracks) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_get_tracks_if_changed_cached(self):
+        tracker = PlaylistChangeTracker()
+        async with AsyncClient(headers={"Accept-Encoding": "identity"}, cache=MemoryCache()) as client:
+            assert await tracker.async_get_tracks_if_changed(client, 908622995) is not None
+            assert await tracker.async_get_tracks_if_changed(client, 908622995) is None
+            # The cached playlist and tracks aren't used
+            tracks = await tracker.async_get_tracks_if_changed(client, 908622995)
+            assert tracks is not None
+            assert len(tracks) == 1
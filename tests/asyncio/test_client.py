@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import json
+
 import pytest
 
 from deezer.asyncio import (
@@ -7,13 +10,47 @@ from deezer.asyncio import (
     AsyncArtist,
     AsyncClient,
     AsyncPaginatedList,
+    AsyncTrack,
 )
+from deezer.cache import MemoryCache
 from deezer.exceptions import DeezerErrorResponse, DeezerNotFoundError
+from deezer.ratelimit import RateLimiter
+from deezer.retry import Retry
 
 pytestmark = pytest.mark.vcr
 
 
 class TestAsyncClient:
+    @pytest.mark.asyncio
+    async def test_hydrate(self, async_client):
+        tracks = [
+            AsyncTrack(async_client, {"id": 3135556, "type": "track"}),
+            AsyncTrack(async_client, {"id": 1425844092, "type": "track"}),
+            AsyncTrack(async_client, {"id": 3135556, "type": "track"}),
+            AsyncTrack(async_client, {"id": 1, "type": "track", "bpm": 100.0}),
+        ]
+        assert await async_client.hydrate(tracks, fields=["bpm"]) == tracks
+        assert [track.bpm for track in tracks] == [123, 0, 123, 100.0]
+        assert tracks[1].title == "STAY"
+        assert "title" not in tracks[3]._fields
+
+    @pytest.mark.asyncio
+    async def test_hydrate_error(self, async_client, mocker):
+        async def request(method: str, path: str, **kwargs) -> AsyncTrack:
+            if path == "track/1":
+                raise DeezerErrorResponse({"error": {"type": "DataException", "message": "no data", "code": 800}})
+            return AsyncTrack(async_client, {"id": int(path.split("/")[1]), "type": "track", "bpm": 123.4})
+
+        mocker.patch.object(async_client, "request", side_effect=request)
+        tracks = [
+            AsyncTrack(async_client, {"id": 1, "type": "track"}),
+            AsyncTrack(async_client, {"id": 3135556, "type": "track"}),
+        ]
+        # The track which couldn't be fetched is left partial
+        assert await async_client.hydrate(tracks, fields=["bpm"]) == tracks
+        assert "bpm" not in tracks[0]._fields
+        assert tracks[1].bpm == 123.4
+
     @pytest.mark.asyncio
     async def test_get_album(self, async_client):
         album = await async_client.get_album(302127)
@@ -38,6 +75,34 @@ class TestAsyncClient:
         assert isinstance(contributors, list)
         assert all(isinstance(c, AsyncArtist) for c in contributors)
 
+    @pytest.mark.asyncio
+    async def test_get_albums(self, async_client):
+        albums = await async_client.get_albums([0, 302127, 0])
+        assert isinstance(albums[0], DeezerNotFoundError)
+        assert isinstance(albums[1], AsyncAlbum)
+        assert albums[1].title == "Discovery"
+        assert albums[2] is albums[0]
+
+    @pytest.mark.asyncio
+    async def test_get_tracks_by_isrc(self):
+        cache = MemoryCache()
+        async with AsyncClient(headers={"Accept-Encoding": "identity"}, cache=cache) as client:
+            tracks = await client.get_tracks_by_isrc(["USSM12103949", "FRZ110000000"])
+            assert isinstance(tracks[0], AsyncTrack)
+            assert tracks[0].title == "STAY"
+            assert tracks[1] is None
+            assert await client.get_track_by_isrc("frz110000000") is None
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_json_loads(self, mocker):
+        json_loads = mocker.Mock(wraps=json.loads)
+        async with AsyncClient(headers={"Accept-Encoding": "identity"}, json_loads=json_loads) as client:
+            album = await client.get_album(302127)
+        assert album.title == "Discovery"
+        json_loads.assert_called_once()
+        assert isinstance(json_loads.call_args.args[0], bytes)
+
     @pytest.mark.asyncio
     async def test_request_not_found(self, async_client):
         with pytest.raises(DeezerNotFoundError):
@@ -60,6 +125,111 @@ class TestAsyncClient:
             album = await client.get_album(302127)
             assert album.title == "Discovery"
 
+    @pytest.mark.asyncio
+    async def test_cache(self):
+        cache = MemoryCache()
+        async with AsyncClient(
+            headers={"Accept-Encoding": "identity"},
+            cache=cache,
+        ) as client:
+            album = await client.get_album(302127)
+            # Served from the cache: the cassette has a single request
+            cached_album = await client.get_album(302127)
+        assert len(cache) == 1
+        assert cached_album is not album
+        assert cached_album.title == album.title == "Discovery"
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter(self, mocker):
+        limiter = RateLimiter()
+        acquire_spy = mocker.spy(limiter, "async_acquire")
+        async with AsyncClient(
+            headers={"Accept-Encoding": "identity"},
+            rate_limiter=limiter,
+        ) as client:
+            await client.get_album(302127)
+        acquire_spy.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_retry(self, mocker):
+        sleep_mock = mocker.patch("deezer.asyncio.client.asyncio.sleep")
+        async with AsyncClient(
+            headers={"Accept-Encoding": "identity"},
+            retry=Retry(jitter=False),
+        ) as client:
+            album = await client.get_album(302127)
+        assert album.title == "Discovery"
+        sleep_mock.assert_called_once_with(0.5)
+
+    @pytest.mark.asyncio
+    async def test_coalesce_requests(self):
+        async with AsyncClient(
+            headers={"Accept-Encoding": "identity"},
+            coalesce_requests=True,
+        ) as client:
+            # The cassette has a single request, shared by all callers
+            albums = await asyncio.gather(*(client.get_album(302127) for _ in range(3)))
+            assert client._in_flight == {}
+        assert len({id(album) for album in albums}) == 3
+        assert len({id(album.artist) for album in albums}) == 3
+        assert all(album.title == "Discovery" for album in albums)
+
+    @pytest.mark.asyncio
+    async def test_coalesce_requests_error(self):
+        async with AsyncClient(
+            headers={"Accept-Encoding": "identity"},
+            coalesce_requests=True,
+        ) as client:
+            results = await asyncio.gather(
+                client.get_album(-1),
+                client.get_album(-1),
+                return_exceptions=True,
+            )
+            assert client._in_flight == {}
+        assert all(isinstance(result, DeezerErrorResponse) for result in results)
+
+    @pytest.fixture()
+    def slow_request(self, mocker):
+        """Make the requests take a while, to cancel them in flight."""
+        content = b'{"id": 302127, "type": "album", "title": "Discovery"}'
+
+        async def request_with_retry(method, path, request_key, event, **kwargs):
+            await asyncio.sleep(0.01)
+            event.status_code = 200
+            return content, json.loads(content)
+
+        return mocker.patch.object(AsyncClient, "_request_with_retry", side_effect=request_with_retry)
+
+    @pytest.mark.asyncio
+    async def test_coalesce_requests_first_caller_cancelled(self, slow_request):
+        events = []
+        async with AsyncClient(coalesce_requests=True, observers=[events.append]) as client:
+            first = asyncio.ensure_future(client.get_album(302127))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(client.get_album(302127))
+            await asyncio.sleep(0)
+            first.cancel()
+            # The request goes on for the other caller
+            album = await second
+            with pytest.raises(asyncio.CancelledError):
+                await first
+        assert album.title == "Discovery"
+        assert slow_request.call_count == 1
+        # The event of the cancelled caller isn't changed afterwards
+        assert [event.status_code for event in events] == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_coalesce_requests_shared_request_cancelled(self, slow_request):
+        async with AsyncClient(coalesce_requests=True) as client:
+            callers = [asyncio.ensure_future(client.get_album(302127)) for _ in range(2)]
+            await asyncio.sleep(0)
+            client._in_flight["GET album/302127"].cancel()
+            # The callers send the request again, still shared
+            albums = await asyncio.gather(*callers)
+            assert client._in_flight == {}
+        assert all(album.title == "Discovery" for album in albums)
+        assert slow_request.call_count == 2
+
     @pytest.mark.asyncio
     @pytest.mark.vcr(match_on=["method", "scheme", "host", "port", "path"])
     async def test_access_token(self):
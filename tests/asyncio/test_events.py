@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from deezer.asyncio import AsyncClient
+
+pytestmark = pytest.mark.vcr
+
+
+class TestAsyncClientEvents:
+    @pytest.mark.asyncio
+    async def test_events(self):
+        events = []
+        async with AsyncClient(
+            headers={"Accept-Encoding": "identity"},
+            observers=[events.append],
+        ) as client:
+            await client.get_album(302127)
+
+        (event,) = events
+        assert event.method == "GET"
+        assert event.endpoint == "album/{id}"
+        assert event.status_code == 200
+        assert event.response_size > 0
+        assert event.cache_hit is False
+        assert event.network_time > 0
+        assert event.parse_time > 0
+
+    @pytest.mark.asyncio
+    async def test_events_coalesced(self):
+        events = []
+        async with AsyncClient(
+            headers={"Accept-Encoding": "identity"},
+            coalesce_requests=True,
+            observers=[events.append],
+        ) as client:
+            await asyncio.gather(client.get_album(302127), client.get_album(302127))
+
+        # Only the caller which sent the request has its status
+        assert sorted(event.status_code or 0 for event in events) == [0, 200]
+        assert events[0].response_size == events[1].response_size > 0
+        assert all(event.parse_time > 0 for event in events)
+
+    @pytest.mark.asyncio
+    async def test_observer_error(self):
+        def failing_observer(event):
+            raise RuntimeError("Boom")
+
+        async with AsyncClient(
+            headers={"Accept-Encoding": "identity"},
+            observers=[failing_observer],
+        ) as client:
+            album = await client.get_album(302127)
+
+        # The response is returned despite the failing observer
+        assert album.title == "Discovery"
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+from typing import Any
+
 import pytest
 import pytest_asyncio
 
@@ -65,6 +68,64 @@ class TestAsyncPaginatedList:
         assert isinstance(album, AsyncAlbum)
         assert album.title == title
 
+    @pytest.mark.asyncio
+    async def test_get_element_random_access(self, async_client):
+        paginated = await AsyncPaginatedList.create(
+            client=async_client,
+            base_path="artist/27/albums",
+            params={"limit": 10},
+        )
+        # Only the page containing the element is fetched
+        assert (await paginated.get(25)).title == "Technologic (Radio Edit)"
+        assert (await paginated.get(21)).title == "Harder, Better, Faster, Stronger (Alive 2007)"
+
+    @pytest.fixture()
+    def requested_indexes(self) -> list[int]:
+        return []
+
+    @pytest_asyncio.fixture()
+    async def short_pages(self, async_client, mocker, requested_indexes):
+        """A list where Deezer returns fewer elements than the page size on the first page."""
+        pages = {0: list(range(23)), 25: list(range(100, 125)), 50: list(range(200, 210))}
+
+        async def request(method: str, path: str, params: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+            index = int(params.get("index", 0))
+            requested_indexes.append(index)
+            next_index = index + 25
+            return {
+                "data": pages[index],
+                "total": 58,
+                "next": f"https://api.deezer.com/{path}?limit=25&index={next_index}" if next_index in pages else None,
+            }
+
+        mocker.patch.object(async_client, "request", side_effect=request)
+        return await AsyncPaginatedList.create(client=async_client, base_path="playlist/1/tracks", page_size=25)
+
+    @pytest.mark.asyncio
+    async def test_get_element_short_page(self, short_pages):
+        elements = [element async for element in short_pages]
+        assert len(elements) == 58
+        assert [await short_pages.get(index) for index in range(58)] == elements
+        assert await short_pages.get(23) == 100
+        with pytest.raises(IndexError):
+            await short_pages.get(58)
+
+    @pytest.mark.asyncio
+    async def test_get_element_short_page_random_access(self, short_pages, requested_indexes):
+        # The first page is short, so the element is on the next page
+        assert await short_pages.get(30) == 107
+        assert await short_pages.get(50) == 202
+        assert requested_indexes == [0, 25, 50]
+
+    @pytest.mark.asyncio
+    async def test_iterator_short_page(self, short_pages):
+        elements = []
+        with pytest.raises(StopAsyncIteration):
+            while True:
+                elements.append(await short_pages.__anext__())
+        assert len(elements) == 58
+        assert elements[23] == 100
+
     @pytest.mark.asyncio
     async def test_get_element_index_error(self, daft_punk_albums):
         with pytest.raises(IndexError):
@@ -81,6 +142,84 @@ class TestAsyncPaginatedList:
         assert len(all_albums) == 32
         assert all(isinstance(a, AsyncAlbum) for a in all_albums)
 
+    @pytest.mark.asyncio
+    async def test_collect_concurrent(self, daft_punk_albums):
+        all_albums = await daft_punk_albums.collect(max_concurrency=2)
+        assert len(all_albums) == 32
+        assert all_albums[0].title == "Human After All (Remixes)"
+        assert all_albums[-1].title == "Da Funk"
+
+    @pytest.mark.asyncio
+    async def test_prefetch_many_pages(self, async_client):
+        paginated = await AsyncPaginatedList.create(
+            client=async_client,
+            base_path="artist/27/albums",
+            params={"limit": 10},
+        )
+        await paginated.prefetch(max_concurrency=2)
+        # The pages are already fetched: no more API calls
+        titles = [album.title async for album in paginated]
+        assert len(titles) == 32
+        assert titles[:3] == [
+            "Human After All (Remixes)",
+            "Random Access Memories",
+            "TRON: Legacy Reconfigured",
+        ]
+        assert titles[-1] == "Da Funk"
+        assert (await paginated.get(25)).title == titles[25]
+
+    @pytest.mark.asyncio
+    async def test_page_size(self, async_client):
+        artist = AsyncArtist(async_client, {"id": 27, "type": "artist"})
+        paginated = await artist.get_albums(page_size=10)
+        titles = [album.title async for album in paginated]
+        assert len(titles) == 32
+        assert titles[-1] == "Da Funk"
+
+    @pytest.mark.asyncio
+    async def test_iter_pages(self, async_client):
+        paginated = await AsyncPaginatedList.create(
+            client=async_client,
+            base_path="artist/27/albums",
+            page_size=10,
+        )
+        page_sizes = [len(page) async for page in paginated.iter_pages()]
+        assert page_sizes == [10, 10, 10, 2]
+
+    @pytest.mark.asyncio
+    async def test_stream(self, async_client):
+        paginated = await AsyncPaginatedList.create(
+            client=async_client,
+            base_path="artist/27/albums",
+            page_size=10,
+        )
+        titles = [album.title async for album in paginated.stream()]
+        assert len(titles) == 32
+        assert titles[-1] == "Da Funk"
+
+    @pytest.mark.asyncio
+    async def test_read_ahead(self, async_client, mocker):
+        fetch_tasks = {}
+        fetch_page = AsyncPaginatedList._fetch_page
+
+        async def record_fetch_task(self, page_number):
+            fetch_tasks[page_number] = asyncio.current_task()
+            return await fetch_page(self, page_number)
+
+        mocker.patch.object(AsyncPaginatedList, "_fetch_page", record_fetch_task)
+        paginated = await AsyncPaginatedList.create(
+            client=async_client,
+            base_path="artist/27/albums",
+            page_size=10,
+            read_ahead=2,
+        )
+        titles = [album.title async for album in paginated]
+        assert len(titles) == 32
+        assert titles[-1] == "Da Funk"
+        # The next pages are fetched in background tasks
+        assert sorted(fetch_tasks) == [0, 1, 2, 3]
+        assert all(fetch_tasks[page_number] is not asyncio.current_task() for page_number in (1, 2, 3))
+
     @pytest.mark.asyncio
     @pytest.mark.vcr(match_on=["method", "scheme", "host", "port", "path"])
     async def test_authenticated_requests(self, async_client_token):
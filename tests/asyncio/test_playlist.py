@@ -46,6 +46,24 @@ class TestAsyncPlaylist:
         result = await playlist.add_tracks([79875054])
         assert result is True
 
+    @pytest.mark.asyncio
+    async def test_add_tracks_in_chunks(self, async_client_token):
+        playlist = AsyncPlaylist(
+            async_client_token,
+            json={"id": 11015569602, "type": "playlist"},
+        )
+        result = await playlist.add_tracks([79875054, 79875064, 79875044], chunk_size=2)
+        assert result is True
+
+    @pytest.mark.asyncio
+    async def test_sync_tracks(self, async_client_token):
+        playlist = AsyncPlaylist(
+            async_client_token,
+            json={"id": 11015569602, "type": "playlist"},
+        )
+        result = await playlist.sync_tracks([79875044, 79875054, 142986210])
+        assert result is True
+
     @pytest.mark.asyncio
     @pytest.mark.vcr(match_on=["method", "scheme", "host", "port", "path"])
     async def test_delete_tracks(self, async_client):
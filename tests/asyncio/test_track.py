@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import copy
+import datetime as dt
+
 import pytest
 
-from deezer.asyncio import AsyncAlbum, AsyncArtist, AsyncTrack
+from deezer.asyncio import AsyncAlbum, AsyncArtist, AsyncClient, AsyncTrack
 
 pytestmark = pytest.mark.vcr
 
@@ -31,3 +34,42 @@ class TestAsyncTrack:
         assert len(contributors) == 2
         assert all(isinstance(c, AsyncArtist) for c in contributors)
         assert [c.id for c in contributors] == [51204222, 288166]
+
+    @pytest.mark.asyncio
+    async def test_lazy_parsing(self):
+        async with AsyncClient(
+            headers={"Accept-Encoding": "identity"},
+            lazy_parsing=True,
+        ) as client:
+            track = await client.get_track(1425844092)
+        assert track._raw is not None
+        assert "release_date" in track._raw
+        assert track.release_date == dt.date(2021, 7, 9)
+        assert isinstance(track.artist, AsyncArtist)
+        assert [artist.id for artist in track.contributors] == [51204222, 288166]
+
+    @pytest.mark.asyncio
+    async def test_identity_map(self):
+        async with AsyncClient(
+            headers={"Accept-Encoding": "identity"},
+            identity_map=True,
+        ) as client:
+            track = await client.get_track(1425844092)
+        assert track.artist.id == 51204222
+        # Contributors have a role specific to this track, they aren't shared
+        assert track.contributors[0] is not track.artist
+        assert track.contributors[0].role == "Main"
+
+    def test_declared_fields_in_slots(self, async_client):
+        track = AsyncTrack(async_client, {"id": 3135556, "type": "track", "not_declared": 42})
+        assert "title" in AsyncTrack.__slots__
+        assert vars(track) == {"not_declared": 42}
+        assert track.as_dict() == {"id": 3135556, "type": "track", "not_declared": 42}
+
+    def test_copy(self, async_client):
+        track = AsyncTrack(async_client, {"id": 3135556, "type": "track", "not_declared": 42})
+        track_copy = copy.copy(track)
+        assert track_copy is not track
+        assert track_copy.client is async_client
+        assert vars(track_copy) == {"not_declared": 42}
+        assert track_copy.as_dict() == track.as_dict()
@@ -58,6 +58,41 @@ class TestPlaylist:
         result = playlist.delete_tracks([track])
         assert result is True
 
+    def test_add_tracks_in_chunks(self, client_token):
+        playlist = deezer.Playlist(client_token, json={"id": 11015569602, "type": "playlist"})
+        result = playlist.add_tracks([79875054, 79875064, 79875044, 142986210, 1724605597], chunk_size=2)
+        assert result is True
+
+    def test_delete_tracks_in_chunks(self, client_token):
+        playlist = deezer.Playlist(client_token, json={"id": 11015569602, "type": "playlist"})
+        # All the chunks are sent, the result is only True if they all succeed
+        result = playlist.delete_tracks([79875054, 79875064, 79875044], chunk_size=2)
+        assert result is False
+
+    def test_sync_tracks(self, client_token):
+        playlist = deezer.Playlist(client_token, json={"id": 11015569602, "type": "playlist"})
+        result = playlist.sync_tracks([79875044, 79875054, 142986210])
+        assert result is True
+
+    def test_sync_tracks_up_to_date(self, client_token):
+        playlist = deezer.Playlist(client_token, json={"id": 11015569602, "type": "playlist"})
+        # Only the current tracks are fetched
+        result = playlist.sync_tracks([79875054, 79875064, 79875044])
+        assert result is True
+
+    def test_sync_tracks_too_long_to_reorder(self, client_token, mocker):
+        playlist = deezer.Playlist(client_token, json={"id": 11015569602, "type": "playlist"})
+        current_tracks = [deezer.Track(client_token, json={"id": i, "type": "track"}) for i in range(1, 601)]
+        mocker.patch.object(playlist, "get_tracks", return_value=mocker.Mock(stream=lambda: iter(current_tracks)))
+        request = mocker.patch.object(client_token, "request", return_value=True)
+        result = playlist.sync_tracks([*range(1, 599), 600, 599])
+        assert result is True
+        # The order of 600 tracks doesn't fit in a request: the last ones are moved instead
+        assert [(call.args[0], call.kwargs["params"]) for call in request.call_args_list] == [
+            ("DELETE", {"songs": "599,600"}),
+            ("POST", {"songs": "600,599"}),
+        ]
+
     def test_reorder_tracks(self, client_token):
         playlist = deezer.Playlist(client_token, json={"id": 11336462844})
         result = playlist.reorder_tracks([79875044, 79875050, 142986210])
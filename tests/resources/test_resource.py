@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import copy
+import datetime as dt
+import pickle
+import weakref
+
 import pytest
 
 import deezer
+from deezer import Track
+from deezer.resources.resource import FIELDS_TUPLES_CACHE_SIZE, _intern_fields
 
 pytestmark = pytest.mark.vcr
 
@@ -53,3 +60,152 @@ class TestResource:
         with pytest.raises(AttributeError) as exc_info:
             episode.something  # noqa  B018
         assert str(exc_info.value) == "'Episode' object has no attribute 'something'"
+
+    def test_declared_fields_in_slots(self, client):
+        track = deezer.Track(
+            client,
+            json={
+                "id": 3135556,
+                "type": "track",
+                "title": "Harder, Better, Faster, Stronger",
+                "not_declared": 42,
+            },
+        )
+        assert "title" in deezer.Track.__slots__
+        assert track.title == "Harder, Better, Faster, Stronger"
+        # Only the fields not declared on the class are stored in a dict
+        assert vars(track) == {"not_declared": 42}
+        assert track.as_dict() == {
+            "id": 3135556,
+            "type": "track",
+            "title": "Harder, Better, Faster, Stronger",
+            "not_declared": 42,
+        }
+
+    def test_copy_no_fetch(self, client, mocker):
+        request = mocker.spy(client, "request")
+        track = deezer.Track(client, json={"id": 3135556, "type": "track", "title": "Around the World"})
+        track_copy = copy.copy(track)
+        assert track_copy is not track
+        assert track_copy.title == "Around the World"
+        assert track_copy._fields == ("id", "type", "title")
+        resource = deezer.Resource(client, json={"id": 1, "type": "resource"})
+        assert copy.copy(resource).id == 1
+        request.assert_not_called()
+
+    def test_pickle(self):
+        track = deezer.Track(None, json={"id": 3135556, "type": "track", "bpm": 123.4, "not_declared": 42})
+        track_copy = pickle.loads(pickle.dumps(track))  # noqa S301
+        assert track_copy.as_dict() == track.as_dict()
+        assert vars(track_copy) == {"not_declared": 42}
+
+    def test_fields_tuple_shared(self, client):
+        track_1 = deezer.Track(client, json={"id": 1, "type": "track"})
+        track_2 = deezer.Track(client, json={"id": 2, "type": "track"})
+        assert track_1._fields == ("id", "type")
+        assert track_1._fields is track_2._fields
+
+    def test_fields_tuple_bounded(self, client):
+        for i in range(FIELDS_TUPLES_CACHE_SIZE + 10):
+            deezer.Track(client, json={"id": i, "type": "track", f"field_{i}": i})
+        assert _intern_fields.cache_info().currsize <= FIELDS_TUPLES_CACHE_SIZE
+
+    def test_lazy_parsing(self):
+        with deezer.Client(
+            headers={"Accept-Encoding": "identity"},
+            lazy_parsing=True,
+        ) as client:
+            track = client.get_track(1425844092)
+        # The fields needing conversion are kept raw until accessed
+        assert track._raw is not None
+        assert {"release_date", "contributors", "artist", "album"} <= track._raw.keys()
+        assert track.title == "STAY"
+        assert track.release_date == dt.date(2021, 7, 9)
+        assert "release_date" not in track._raw
+        assert isinstance(track.album, deezer.Album)
+        assert [artist.id for artist in track.contributors] == [51204222, 288166]
+        assert all(isinstance(artist, deezer.Artist) for artist in track.contributors)
+        assert track.as_dict()["release_date"] == "2021-07-09"
+        assert track._raw is None
+
+    def test_lazy_parsing_parent(self):
+        with deezer.Client(
+            headers={"Accept-Encoding": "identity"},
+            lazy_parsing=True,
+        ) as client:
+            album = client.get_album(302127)
+            track = album.get_tracks()[0]
+        # The nested resources get the parent, as without lazy parsing
+        assert track.album is album
+        assert track.artist.album is album
+
+    def test_identity_map(self):
+        with deezer.Client(
+            headers={"Accept-Encoding": "identity"},
+            identity_map=True,
+        ) as client:
+            daft_punk = client.get_artist(27)
+            tracks = daft_punk.get_top()[:5]
+        # The resources with the same type and ID are the same object
+        assert tracks[0].album is tracks[4].album
+        assert tracks[2].album is tracks[3].album
+        assert tracks[0].album is not tracks[2].album
+        assert all(track.artist is daft_punk for track in tracks)
+        # Contributors have a role specific to each track, they aren't shared
+        contributors = [artist for track in tracks for artist in track.contributors if artist.id == 27]
+        assert len(contributors) == 5
+        assert all(artist is not daft_punk and artist.role == "Main" for artist in contributors)
+        assert len({id(artist) for artist in contributors}) == 5
+        assert "role" not in daft_punk._fields
+
+    def test_identity_map_update(self):
+        with deezer.Client(
+            headers={"Accept-Encoding": "identity"},
+            identity_map=True,
+        ) as client:
+            daft_punk = client.get_artist(27)
+            assert daft_punk.nb_fan == 3677952
+            # Fetching it again updates the shared object
+            assert client.get_artist(27) is daft_punk
+        assert daft_punk.nb_fan == 3678952
+
+    def test_identity_map_weak(self, client):
+        client._identity_map = weakref.WeakValueDictionary()
+        album = client._process_json({"id": 302127, "type": "album", "title": "Discovery"})
+        assert client._process_json({"id": 302127, "type": "album"}) is album
+        assert len(client._identity_map) == 1
+        # Resources no longer in use are dropped from the identity map
+        del album
+        assert len(client._identity_map) == 0
+
+    def test_identity_map_relation_fields(self, client):
+        client._identity_map = weakref.WeakValueDictionary()
+        track = client._process_json({"id": 3135556, "type": "track", "title": "Harder, Better, Faster, Stronger"})
+        playlist_tracks = [
+            client._process_json({"id": 3135556, "type": "track", "time_add": time_add})
+            for time_add in (1600000000, 1700000000)
+        ]
+        # Each occurrence keeps its own time of addition to a playlist
+        assert [t.time_add for t in playlist_tracks] == [1600000000, 1700000000]
+        assert all(t is not track for t in playlist_tracks)
+        assert not hasattr(track, "time_add")
+
+    def test_field_parsers(self, client):
+        assert Track._field_parsers.keys() == {"release_date", "contributors"}
+
+        class CustomTrack(Track):
+            def _parse_title(self, value):
+                return value.upper()
+
+        assert CustomTrack._field_parsers.keys() == {"release_date", "contributors", "title"}
+        track = CustomTrack(
+            client,
+            json={
+                "id": 3135556,
+                "type": "track",
+                "title": "Harder, Better, Faster, Stronger",
+                "release_date": "2001-03-07",
+            },
+        )
+        assert track.title == "HARDER, BETTER, FASTER, STRONGER"
+        assert track.release_date == dt.date(2001, 3, 7)
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import pytest
+
+import deezer
+from deezer.cache import MemoryCache, SQLiteCache
+from deezer.exceptions import DeezerErrorResponse
+
+
+class TestMemoryCache:
+    def test_get_missing(self):
+        cache = MemoryCache()
+        assert cache.get("GET artist/27") is None
+
+    def test_set_and_get(self):
+        cache = MemoryCache()
+        cache.set("GET artist/27", b'{"id":27}', "artist")
+        assert cache.get("GET artist/27") == b'{"id":27}'
+
+    def test_expired(self, mocker):
+        time_mock = mocker.patch("deezer.cache.time.time", return_value=1000)
+        cache = MemoryCache(ttl=10)
+        cache.set("GET artist/27", b'{"id":27}', "artist")
+
+        time_mock.return_value = 1009
+        assert cache.get("GET artist/27") == b'{"id":27}'
+        time_mock.return_value = 1010
+        assert cache.get("GET artist/27") is None
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize(
+        ("endpoint", "ttl"),
+        [
+            ("artist", 10),
+            ("chart", 3600),
+            ("genre", 86400),
+            ("radio", 5),
+        ],
+    )
+    def test_endpoint_ttls(self, endpoint, ttl):
+        cache = MemoryCache(ttl=10, endpoint_ttls={"radio": 5})
+        assert cache.get_ttl(endpoint) == ttl
+
+    def test_evict_least_recently_used(self):
+        cache = MemoryCache(maxsize=2)
+        cache.set("GET artist/1", b"1", "artist")
+        cache.set("GET artist/2", b"2", "artist")
+        # Accessing the first entry makes the second one the least recently used
+        assert cache.get("GET artist/1") == b"1"
+        cache.set("GET artist/3", b"3", "artist")
+
+        assert len(cache) == 2
+        assert cache.get("GET artist/1") == b"1"
+        assert cache.get("GET artist/2") is None
+        assert cache.get("GET artist/3") == b"3"
+
+    def test_delete(self):
+        cache = MemoryCache()
+        cache.set("GET playlist/1", b"1", "playlist")
+        cache.set("GET playlist/1/tracks?index=25", b"2", "playlist")
+        cache.set("GET playlist/1/tracks token:0123456789abcdef", b"3", "playlist")
+        cache.set("GET playlist/12", b"4", "playlist")
+        cache.delete("playlist/1")
+        assert len(cache) == 1
+        assert cache.get("GET playlist/12") == b"4"
+
+    def test_clear(self):
+        cache = MemoryCache()
+        cache.set("GET artist/27", b'{"id":27}', "artist")
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestSQLiteCache:
+    @pytest.fixture()
+    def cache(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.sqlite")
+        yield cache
+        cache.close()
+
+    def test_get_missing(self, cache):
+        assert cache.get("GET artist/27") is None
+
+    def test_set_and_get(self, cache):
+        cache.set("GET artist/27", b'{"id":27}', "artist")
+        assert cache.get("GET artist/27") == b'{"id":27}'
+
+    def test_replace(self, cache):
+        cache.set("GET artist/27", b'{"id":27}', "artist")
+        cache.set("GET artist/27", b'{"id":27,"name":"Daft Punk"}', "artist")
+        assert len(cache) == 1
+        assert cache.get("GET artist/27") == b'{"id":27,"name":"Daft Punk"}'
+
+    def test_expired(self, mocker, cache):
+        time_mock = mocker.patch("deezer.cache.time.time", return_value=1000)
+        cache.set("GET chart/0", b'{"id":0}', "chart")
+
+        time_mock.return_value = 1000 + 3599
+        assert cache.get("GET chart/0") == b'{"id":0}'
+        time_mock.return_value = 1000 + 3600
+        assert cache.get("GET chart/0") is None
+        assert len(cache) == 0
+
+    def test_delete_expired(self, mocker, cache):
+        time_mock = mocker.patch("deezer.cache.time.time", return_value=1000)
+        cache.set("GET artist/27", b'{"id":27}', "artist")
+        cache.set("GET genre/0", b'{"id":0}', "genre")
+
+        time_mock.return_value = 2000
+        cache.delete_expired()
+        assert len(cache) == 1
+        assert cache.get("GET genre/0") == b'{"id":0}'
+
+    def test_delete(self, cache):
+        cache.set("GET playlist/1", b"1", "playlist")
+        cache.set("GET playlist/1/tracks?index=25", b"2", "playlist")
+        cache.set("GET playlist/1/tracks token:0123456789abcdef", b"3", "playlist")
+        cache.set("GET playlist/12", b"4", "playlist")
+        cache.delete("playlist/1")
+        assert len(cache) == 1
+        assert cache.get("GET playlist/12") == b"4"
+
+    def test_clear(self, cache):
+        cache.set("GET artist/27", b'{"id":27}', "artist")
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_persistence(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.sqlite")
+        cache.set("GET artist/27", b'{"id":27}', "artist")
+        cache.close()
+
+        reopened_cache = SQLiteCache(tmp_path / "cache.sqlite")
+        assert reopened_cache.get("GET artist/27") == b'{"id":27}'
+        reopened_cache.close()
+
+    @pytest.mark.vcr
+    def test_client_restart(self, tmp_path):
+        for _ in range(2):
+            cache = SQLiteCache(tmp_path / "cache.sqlite")
+            with deezer.Client(
+                headers={"Accept-Encoding": "identity"},
+                cache=cache,
+            ) as client:
+                # The cassette has a single request: second run hits the cache
+                artist = client.get_artist(27)
+            cache.close()
+            assert artist.name == "Daft Punk"
+
+
+@pytest.mark.vcr
+class TestClientCache:
+    @pytest.fixture()
+    def cache(self):
+        return MemoryCache()
+
+    @pytest.fixture()
+    def client(self, cache):
+        with deezer.Client(
+            headers={"Accept-Encoding": "identity"},
+            cache=cache,
+        ) as client:
+            yield client
+
+    def test_get_cached(self, client, cache):
+        artist = client.get_artist(27)
+        # Served from the cache: the cassette has a single request
+        cached_artist = client.get_artist(27)
+
+        assert len(cache) == 1
+        assert cached_artist is not artist
+        assert cached_artist.name == artist.name == "Daft Punk"
+
+    def test_cache_key_params_order(self, client):
+        assert client._get_request_key("GET", "search", {"q": "Daft Punk", "limit": 2}) == (
+            client._get_request_key("GET", "search", {"limit": ["2"], "q": "Daft Punk"})
+        )
+
+    @pytest.mark.parametrize("method", ["POST", "DELETE"])
+    def test_cache_key_not_get(self, client, method):
+        assert client._get_request_key(method, "user/me/tracks", {"track_id": 3135556}) is None
+
+    def test_cache_key_access_token(self, client, cache):
+        with (
+            deezer.Client(access_token="token-1", cache=cache) as client_1,  # noqa: S106
+            deezer.Client(access_token="token-2", cache=cache) as client_2,  # noqa: S106
+        ):
+            keys = {c._get_request_key("GET", "user/me/tracks") for c in (client, client_1, client_2)}
+            assert len(keys) == 3
+            assert all(key is not None and "token-1" not in key for key in keys)
+
+    def test_evicted_after_change(self, client, mocker):
+        playlist_track_ids = [1, 2, 3]
+
+        def send(
+            http_client: httpx.Client, method: str, path: str, params: dict[str, Any], **kwargs: Any
+        ) -> httpx.Response:
+            """Serve the tracks of a playlist, changed by the other requests."""
+            payload: Any
+            if method == "GET":
+                tracks = [{"id": track_id, "type": "track"} for track_id in playlist_track_ids]
+                payload = {"data": tracks, "total": len(tracks)}
+            else:
+                songs = [int(track_id) for track_id in params.get("songs", "").split(",") if track_id]
+                if method == "DELETE":
+                    playlist_track_ids[:] = [track_id for track_id in playlist_track_ids if track_id not in songs]
+                elif songs:
+                    playlist_track_ids.extend(songs)
+                else:
+                    playlist_track_ids[:] = [int(track_id) for track_id in params["order"].split(",")]
+                payload = True
+            return httpx.Response(200, json=payload, request=httpx.Request(method, f"https://api.deezer.com/{path}"))
+
+        mocker.patch.object(httpx.Client, "request", autospec=True, side_effect=send)
+        playlist = deezer.Playlist(client, json={"id": 1, "type": "playlist"})
+        assert playlist.sync_tracks([1, 2, 3, 4]) is True
+        # The tracks cached before the change aren't used
+        assert playlist.sync_tracks([1, 2, 3, 4, 5]) is True
+        assert playlist_track_ids == [1, 2, 3, 4, 5]
+
+    def test_error_not_cached(self, client, cache):
+        for _ in range(2):
+            with pytest.raises(DeezerErrorResponse):
+                client.get_album(-1)
+        assert len(cache) == 0
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+
+import deezer
+from deezer.cache import MemoryCache
+from deezer.changes import PlaylistChangeTracker
+
+
+class TestPlaylistChangeTracker:
+    def test_has_changed(self, client):
+        tracker = PlaylistChangeTracker()
+        playlist = deezer.Playlist(client, json={"id": 1, "checksum": "3b5a9d6c", "type": "playlist"})
+        assert tracker.has_changed(playlist)
+        tracker.remember(playlist)
+        assert not tracker.has_changed(playlist)
+        tracker.forget(1)
+        assert tracker.has_changed(playlist)
+
+    def test_checksums_mapping(self, client):
+        checksums = {1: "3b5a9d6c"}
+        tracker = PlaylistChangeTracker(checksums)
+        playlist = deezer.Playlist(client, json={"id": 1, "checksum": "f0e4c2f2", "type": "playlist"})
+        assert tracker.has_changed(playlist)
+        tracker.remember(playlist)
+        assert checksums == {1: "f0e4c2f2"}
+
+    @pytest.mark.vcr
+    def test_get_tracks_if_changed(self, client):
+        tracker = PlaylistChangeTracker()
+        tracks = tracker.get_tracks_if_changed(client, 908622995)
+        assert tracks is not None
+        assert [track.id for track in tracks] == [3135556, 1425844092]
+        # Unchanged: only the playlist is fetched
+        assert tracker.get_tracks_if_changed(client, 908622995) is None
+        tracks = tracker.get_tracks_if_changed(client, 908622995)
+        assert tracks is not None
+        assert [track.id for track in tracks] == [3135556]
+        assert tracker.checksums == {908622995: "f0e4c2f2"}
+
+    @pytest.mark.vcr
+    def test_get_tracks_if_changed_cached(self):
+        tracker = PlaylistChangeTracker()
+        with deezer.Client(headers={"Accept-Encoding": "identity"}, cache=MemoryCache()) as client:
+            tracks = tracker.get_tracks_if_changed(client, 908622995)
+            assert tracks is not None
+            assert len(list(tracks)) == 2
+            assert tracker.get_tracks_if_changed(client, 908622995) is None
+            # The cached playlist and tracks aren't used
+            tracks = tracker.get_tracks_if_changed(client, 908622995)
+            assert tracks is not None
+            assert [track.id for track in tracks] == [3135556]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 
 import deezer
+from deezer.cache import MemoryCache
 from deezer.exceptions import (
     DeezerErrorResponse,
     DeezerNotFoundError,
@@ -26,6 +29,17 @@ class TestClient:
         album = client.get_album(302127)
         assert isinstance(album, deezer.Album)
 
+    def test_get_albums(self, client):
+        albums = client.get_albums([302127, -1, 302127])
+        assert isinstance(albums[0], deezer.Album)
+        assert albums[0].title == "Discovery"
+        assert isinstance(albums[1], DeezerErrorResponse)
+        assert albums[2] is albums[0]
+
+    def test_get_album_by_upc(self, client):
+        assert client.get_album_by_upc("724384960650").title == "Discovery"
+        assert client.get_album_by_upc("000000000000") is None
+
     def test_no_album_raise(self, client):
         """Test method get_album for invalid value."""
         with pytest.raises(DeezerErrorResponse):
@@ -218,6 +232,67 @@ class TestClient:
         track = client.get_track(3135556)
         assert isinstance(track, deezer.Track)
 
+    def test_hydrate(self, client):
+        tracks = [
+            deezer.Track(client, json={"id": 3135556, "type": "track"}),
+            deezer.Track(client, json={"id": 1425844092, "type": "track"}),
+            deezer.Track(client, json={"id": 3135556, "type": "track"}),
+            deezer.Track(client, json={"id": 1, "type": "track", "bpm": 100.0}),
+        ]
+        # Each track is fetched once, the ones having the fields are skipped
+        assert client.hydrate(iter(tracks), fields=["bpm"]) == tracks
+        assert [track.bpm for track in tracks] == [123.4, 0, 123.4, 100.0]
+        assert tracks[0].title == tracks[2].title == "Harder, Better, Faster, Stronger"
+        assert tracks[0].album is tracks[2].album
+        assert "title" in tracks[0]._fields
+        assert "title" not in tracks[3]._fields
+
+    def test_hydrate_error(self, client, mocker):
+        def request(method: str, path: str, **kwargs) -> deezer.Track:
+            if path == "track/1":
+                raise DeezerErrorResponse({"error": {"type": "DataException", "message": "no data", "code": 800}})
+            return deezer.Track(client, json={"id": int(path.split("/")[1]), "type": "track", "bpm": 123.4})
+
+        mocker.patch.object(client, "request", side_effect=request)
+        tracks = [
+            deezer.Track(client, json={"id": 1, "type": "track"}),
+            deezer.Track(client, json={"id": 3135556, "type": "track"}),
+        ]
+        # The track which couldn't be fetched is left partial
+        assert client.hydrate(tracks, fields=["bpm"]) == tracks
+        assert "bpm" not in tracks[0]._fields
+        assert tracks[1].bpm == 123.4
+
+    def test_get_tracks(self, client):
+        tracks = client.get_tracks(iter([-1, 3135556]))
+        assert isinstance(tracks[0], DeezerErrorResponse)
+        assert isinstance(tracks[1], deezer.Track)
+        assert tracks[1].id == 3135556
+        assert client.get_tracks([]) == []
+
+    def test_get_tracks_by_isrc(self):
+        cache = MemoryCache()
+        with deezer.Client(headers={"Accept-Encoding": "identity"}, cache=cache) as client:
+            tracks = client.get_tracks_by_isrc(["GBDUW0000059", "FRZ110000000", " gbduw0000059"])
+            assert isinstance(tracks[0], deezer.Track)
+            assert tracks[0].id == 3135556
+            assert tracks[1] is None
+            assert tracks[2] is tracks[0]
+            # Both results are cached: the cassette has a single request for each
+            assert len(cache) == 2
+            assert client.get_track_by_isrc("FRZ110000000") is None
+            track = client.get_track_by_isrc("GBDUW0000059")
+            assert track is not None
+            assert track.id == 3135556
+
+    def test_json_loads(self, mocker):
+        json_loads = mocker.Mock(wraps=json.loads)
+        with deezer.Client(headers={"Accept-Encoding": "identity"}, json_loads=json_loads) as client:
+            track = client.get_track(3135556)
+        assert track.id == 3135556
+        json_loads.assert_called_once()
+        assert isinstance(json_loads.call_args.args[0], bytes)
+
     def test_no_track_raise(self, client):
         """Test method get_track for invalid value."""
         with pytest.raises(DeezerErrorResponse):
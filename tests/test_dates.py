@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import datetime as dt
+import timeit
+
+import pytest
+
+from deezer.dates import DATE_FORMAT, parse_date, parse_datetime
+
+
+@pytest.mark.parametrize(
+    ("date_str", "expected"),
+    [
+        ("2021-07-09", dt.date(2021, 7, 9)),
+        ("0000-00-00", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_date(date_str, expected):
+    assert parse_date(date_str) == expected
+
+
+@pytest.mark.parametrize("date_str", ["09/07/2021", "2024-W01-1", "20240101", "2024-001"])
+def test_parse_date_invalid(date_str):
+    with pytest.raises(ValueError, match="does not match format"):
+        parse_date(date_str)
+
+
+def test_parse_datetime_invalid():
+    with pytest.raises(ValueError, match="does not match format"):
+        parse_datetime("2021-07-09T13:45:30")
+
+
+@pytest.mark.parametrize(
+    ("datetime_str", "date_format", "expected"),
+    [
+        ("2021-07-09 13:45:30", "%Y-%m-%d %H:%M:%S", dt.datetime(2021, 7, 9, 13, 45, 30)),
+        ("0000-00-00 00:00:00", "%Y-%m-%d %H:%M:%S", None),
+        ("09/07/2021 13:45", "%d/%m/%Y %H:%M", dt.datetime(2021, 7, 9, 13, 45)),
+    ],
+)
+def test_parse_datetime(datetime_str, date_format, expected):
+    assert parse_datetime(datetime_str, date_format) == expected
+
+
+def test_parse_date_cached():
+    assert parse_date("2013-05-17") is parse_date("2013-05-17")
+
+
+@pytest.mark.benchmark
+def test_parse_date_benchmark():
+    """The fast path is much faster than strptime, even without the cache."""
+    date_strs = [f"20{year:02}-{month:02}-{day:02}" for year in range(10) for month in range(1, 13) for day in (1, 15)]
+    uncached_parse_date = parse_date.__wrapped__
+
+    fast_duration = min(
+        timeit.repeat(lambda: [uncached_parse_date(date_str) for date_str in date_strs], number=10, repeat=3)
+    )
+    strptime_duration = min(
+        timeit.repeat(
+            lambda: [dt.datetime.strptime(date_str, DATE_FORMAT).date() for date_str in date_strs],
+            number=10,
+            repeat=3,
+        )
+    )
+    assert fast_duration * 3 < strptime_duration
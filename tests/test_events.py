@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import pytest
+
+import deezer
+from deezer.cache import MemoryCache
+from deezer.events import RequestEvent, get_endpoint_template
+from deezer.exceptions import DeezerErrorResponse
+from deezer.retry import Retry
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("artist/27", "artist/{id}"),
+        ("/artist/27/top", "artist/{id}/top"),
+        ("chart/0/tracks", "chart/{id}/tracks"),
+        ("track/-1", "track/{id}"),
+        ("user/me/tracks", "user/me/tracks"),
+        ("track/isrc:GBDUW0000059", "track/isrc:{isrc}"),
+        ("album/upc:724384960650", "album/upc:{upc}"),
+        ("search/album", "search/album"),
+    ],
+)
+def test_get_endpoint_template(path, expected):
+    assert get_endpoint_template(path) == expected
+
+
+def test_request_event_repr():
+    event = RequestEvent("get", "artist/27/top")
+    event.status_code = 200
+    assert repr(event) == "<RequestEvent: GET artist/{id}/top 200>"
+
+
+@pytest.mark.vcr
+class TestClientEvents:
+    @pytest.fixture()
+    def events(self):
+        return []
+
+    def test_events(self, events):
+        with deezer.Client(
+            headers={"Accept-Encoding": "identity"},
+            cache=MemoryCache(),
+            observers=[events.append],
+        ) as client:
+            client.get_artist(27)
+            client.get_artist(27)
+
+        event, cached_event = events
+        assert event.method == "GET"
+        assert event.path == "artist/27"
+        assert event.endpoint == "artist/{id}"
+        assert event.status_code == 200
+        assert event.response_size > 0
+        assert event.cache_hit is False
+        assert event.retries == 0
+        assert event.network_time > 0
+        assert event.parse_time > 0
+        assert event.error is None
+
+        assert cached_event.status_code is None
+        assert cached_event.response_size == event.response_size
+        assert cached_event.cache_hit is True
+        assert cached_event.network_time == 0
+        assert cached_event.parse_time > 0
+
+    def test_event_retries(self, mocker, events):
+        mocker.patch("deezer.client.time.sleep")
+        with deezer.Client(
+            headers={"Accept-Encoding": "identity"},
+            retry=Retry(total=2, jitter=False),
+        ) as client:
+            client.observers.append(events.append)
+            client.get_artist(27)
+
+        (event,) = events
+        assert event.status_code == 200
+        assert event.retries == 1
+
+    def test_event_error(self, client, events):
+        client.observers.append(events.append)
+        with pytest.raises(DeezerErrorResponse) as exc_info:
+            client.get_track(-1)
+
+        (event,) = events
+        assert event.endpoint == "track/{id}"
+        assert event.status_code == 200
+        assert event.error is exc_info.value
+
+    def test_observer_error(self, client, events, caplog):
+        def failing_observer(event):
+            raise RuntimeError("Boom")
+
+        client.observers.extend([failing_observer, events.append])
+        with pytest.raises(DeezerErrorResponse) as exc_info:
+            client.get_track(-1)
+
+        # The original error is raised, and the next observers are called
+        (event,) = events
+        assert event.error is exc_info.value
+        assert "Observer" in caplog.text
+        assert "Boom" in caplog.text
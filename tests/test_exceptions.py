@@ -4,9 +4,12 @@ import httpx
 import pytest
 
 from deezer.exceptions import (
+    DeezerErrorResponse,
     DeezerForbiddenError,
     DeezerHTTPError,
     DeezerNotFoundError,
+    DeezerQuotaExceededError,
+    DeezerRetryableException,
     DeezerRetryableHTTPError,
 )
 
@@ -17,6 +20,7 @@ from deezer.exceptions import (
         (403, DeezerForbiddenError),
         (404, DeezerNotFoundError),
         (418, DeezerHTTPError),
+        (429, DeezerRetryableHTTPError),
         (502, DeezerRetryableHTTPError),
     ],
 )
@@ -30,3 +34,21 @@ def test_deezer_http_error(status_code, expected_exception):
 
     exc = DeezerHTTPError.from_http_error(http_error)
     assert isinstance(exc, expected_exception)
+
+
+@pytest.mark.parametrize(
+    ("json_data", "expected_exception"),
+    [
+        ({"error": {"type": "DataException", "message": "no data", "code": 800}}, DeezerErrorResponse),
+        ({"error": {"type": "Exception", "message": "Quota limit exceeded", "code": 4}}, DeezerQuotaExceededError),
+    ],
+)
+def test_deezer_error_response(json_data, expected_exception):
+    exc = DeezerErrorResponse.from_json(json_data)
+    assert type(exc) is expected_exception
+    assert exc.json_data == json_data
+
+
+def test_deezer_quota_exceeded_is_retryable():
+    exc = DeezerErrorResponse.from_json({"error": {"code": 4}})
+    assert isinstance(exc, DeezerRetryableException)
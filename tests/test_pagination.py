@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import threading
+from typing import Any
+
 import pytest
 
+import deezer
 from deezer import Album, Artist, PaginatedList
+from deezer.pagination import get_base_params, locate_element
 
 pytestmark = pytest.mark.vcr
 
@@ -42,6 +47,8 @@ class TestPaginatedList:
     def test_total(self, daft_punk_albums):
         assert daft_punk_albums.total == 32
         assert len(daft_punk_albums) == 32
+        # The first page was fetched to get the total, and is reused
+        assert daft_punk_albums[0].title == "Human After All (Remixes)"
 
     def test_iterate(self, daft_punk_albums):
         iter_count = 0
@@ -72,6 +79,16 @@ class TestPaginatedList:
         assert isinstance(album, Album)
         assert album.title == title
 
+    def test_get_element_random_access(self, client):
+        albums = PaginatedList(
+            client=client,
+            base_path="artist/27/albums",
+            params={"limit": 10},
+        )
+        # Only the first page and the page containing the element are fetched
+        assert albums[25].title == "Technologic (Radio Edit)"
+        assert albums[21].title == "Harder, Better, Faster, Stronger (Alive 2007)"
+
     def test_get_element_index_error(self, daft_punk_albums):
         with pytest.raises(IndexError):
             daft_punk_albums[40]
@@ -106,6 +123,59 @@ class TestPaginatedList:
             "Da Funk",
         ]
 
+    def test_slicing_random_access(self, client):
+        albums = PaginatedList(
+            client=client,
+            base_path="artist/27/albums",
+            params={"limit": 10},
+        )
+        # Pages before the start of the slice aren't fetched
+        assert [a.title for a in albums[25:32:3]] == [
+            "Technologic (Radio Edit)",
+            "Digital Love",
+            "Da Funk",
+        ]
+
+    @pytest.fixture()
+    def requested_indexes(self) -> list[int]:
+        return []
+
+    @pytest.fixture()
+    def short_pages(self, client, mocker, requested_indexes):
+        """A list where Deezer returns fewer elements than the page size on the first page."""
+        pages = {0: list(range(23)), 25: list(range(100, 125)), 50: list(range(200, 210))}
+
+        def request(method: str, path: str, params: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+            index = int(params.get("index", 0))
+            requested_indexes.append(index)
+            next_index = index + 25
+            return {
+                "data": pages[index],
+                "total": 58,
+                "next": f"https://api.deezer.com/{path}?limit=25&index={next_index}" if next_index in pages else None,
+            }
+
+        mocker.patch.object(client, "request", side_effect=request)
+        return PaginatedList(client=client, base_path="playlist/1/tracks", page_size=25)
+
+    def test_get_element_short_page(self, short_pages):
+        elements = list(short_pages)
+        assert len(elements) == 58
+        assert [short_pages[index] for index in range(58)] == elements
+        assert short_pages[23] == 100
+        with pytest.raises(IndexError):
+            short_pages[58]
+
+    def test_get_element_short_page_random_access(self, short_pages, requested_indexes):
+        # The first page is short, so the element is on the next page
+        assert short_pages[30] == 107
+        assert short_pages[50] == 202
+        assert requested_indexes == [0, 25, 50]
+
+    def test_slicing_short_page(self, short_pages):
+        assert short_pages[22:26] == [22, 100, 101, 102]
+        assert short_pages[47:50] == [124, 200, 201]
+
     def test_slicing_with_step(self, daft_punk_albums):
         albums = daft_punk_albums[2:10:2]
         assert [a.title for a in albums] == [
@@ -115,6 +185,128 @@ class TestPaginatedList:
             "Alive 1997",
         ]
 
+    def test_prefetch(self, daft_punk_albums):
+        daft_punk_albums.prefetch()
+        # The pages are already fetched: no more API calls
+        albums = list(daft_punk_albums)
+        assert len(albums) == 32
+        assert albums[0].title == "Human After All (Remixes)"
+        assert albums[-1].title == "Da Funk"
+
+    def test_prefetch_many_pages(self, client):
+        albums = PaginatedList(
+            client=client,
+            base_path="artist/27/albums",
+            params={"limit": 10},
+        )
+        albums.prefetch(max_workers=2)
+        titles = [album.title for album in albums]
+        assert len(titles) == 32
+        assert titles[:3] == [
+            "Human After All (Remixes)",
+            "Random Access Memories",
+            "TRON: Legacy Reconfigured",
+        ]
+        assert titles[-1] == "Da Funk"
+        assert albums.total == 32
+
+    def test_prefetch_single_page(self, client):
+        results = client.search_artists("rouquine")
+        results.prefetch()
+        assert [artist.name for artist in results] == ["Rouquine", "Rouquined"]
+
+    def test_page_size(self, client):
+        albums = PaginatedList(
+            client=client,
+            base_path="artist/27/albums",
+            page_size=10,
+        )
+        titles = [album.title for album in albums]
+        assert len(titles) == 32
+        assert titles[-1] == "Da Funk"
+
+    def test_client_page_size(self):
+        with deezer.Client(headers={"Accept-Encoding": "identity"}, page_size=10) as client:
+            artist = Artist(client, {"id": 27, "type": "artist"})
+            albums = artist.get_albums()
+            assert albums[25].title == "Technologic (Radio Edit)"
+            assert albums.total == 32
+
+    def test_iter_pages(self, client, mocker):
+        albums = PaginatedList(
+            client=client,
+            base_path="artist/27/albums",
+            page_size=10,
+        )
+        store_page_spy = mocker.spy(albums, "_store_page")
+        pages = [[album.title for album in page] for page in albums.iter_pages()]
+        assert [len(page) for page in pages] == [10, 10, 10, 2]
+        assert pages[-1] == ["One More Time", "Da Funk"]
+        # The pages aren't kept in the list
+        store_page_spy.assert_not_called()
+
+    def test_stream(self, client):
+        albums = PaginatedList(
+            client=client,
+            base_path="artist/27/albums",
+            page_size=10,
+        )
+        titles = [album.title for album in albums.stream()]
+        assert len(titles) == 32
+        assert titles[0] == "Human After All (Remixes)"
+        assert titles[-1] == "Da Funk"
+        assert albums.total == 32
+
+    def test_read_ahead(self, client, mocker):
+        albums = PaginatedList(
+            client=client,
+            base_path="artist/27/albums",
+            page_size=10,
+            read_ahead=2,
+        )
+        fetch_threads = {}
+        fetch_page = albums._fetch_page
+
+        def record_fetch_thread(page_number):
+            fetch_threads[page_number] = threading.current_thread()
+            return fetch_page(page_number)
+
+        mocker.patch.object(albums, "_fetch_page", side_effect=record_fetch_thread)
+        titles = [album.title for album in albums]
+        assert len(titles) == 32
+        assert titles[-1] == "Da Funk"
+        # The first page is needed to know the page size, the next ones are read ahead
+        assert fetch_threads[0] is threading.main_thread()
+        assert sorted(fetch_threads) == [0, 1, 2, 3]
+        assert all(fetch_threads[page_number] is not threading.main_thread() for page_number in (1, 2, 3))
+
+    @pytest.mark.parametrize(
+        ("params", "page_size", "expected"),
+        [
+            (None, None, {}),
+            ({"q": "Daft Punk"}, 50, {"q": "Daft Punk", "limit": 50}),
+            ({"limit": 2}, 50, {"limit": 2}),
+        ],
+    )
+    def test_get_base_params(self, params, page_size, expected):
+        assert get_base_params(params, page_size) == expected
+
+    @pytest.mark.parametrize(
+        ("pages", "last_page", "index", "expected"),
+        [
+            ({0: range(25)}, None, 900, (36, 0)),
+            ({0: range(25)}, None, 24, (0, 24)),
+            ({0: range(23)}, None, 30, (1, 7)),
+            ({0: range(23), 2: range(25)}, None, 72, (2, 24)),
+            ({0: range(25), 1: range(20)}, None, 75, (3, 5)),
+            ({0: range(25), 1: range(10)}, 1, 34, (1, 9)),
+            ({0: range(25), 1: range(10)}, 1, 35, None),
+            ({0: range(25)}, 1, 60, None),
+        ],
+    )
+    def test_locate_element(self, pages, last_page, index, expected):
+        assert locate_element(pages, 25, last_page, index) == expected
+
     def test_authenticated_requests(self, client_token):
         user_tracks = PaginatedList(
             client=client_token,
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pytest
+
+import deezer
+from deezer.ratelimit import RateLimiter
+
+
+class TestRateLimiter:
+    @pytest.fixture()
+    def monotonic(self, mocker):
+        return mocker.patch("deezer.ratelimit.time.monotonic", return_value=100.0)
+
+    def test_within_quota(self, monotonic):
+        limiter = RateLimiter(max_calls=3, period=5)
+        assert [limiter._reserve() for _ in range(3)] == [0, 0, 0]
+
+    def test_above_quota(self, monotonic):
+        limiter = RateLimiter(max_calls=3, period=5)
+        for _ in range(3):
+            limiter._reserve()
+        monotonic.return_value = 101.0
+        assert limiter._reserve() == 4.0
+        # The following one is scheduled after the one above
+        assert limiter._reserve() == 4.0
+        assert limiter._reserve() == 4.0
+        assert limiter._reserve() == 9.0
+
+    def test_slots_released(self, monotonic):
+        limiter = RateLimiter(max_calls=3, period=5)
+        for _ in range(3):
+            limiter._reserve()
+        monotonic.return_value = 105.0
+        assert limiter._reserve() == 0
+
+    def test_acquire(self, mocker, monotonic):
+        sleep_mock = mocker.patch("deezer.ratelimit.time.sleep")
+        limiter = RateLimiter(max_calls=1, period=5)
+
+        limiter.acquire()
+        sleep_mock.assert_not_called()
+        limiter.acquire()
+        sleep_mock.assert_called_once_with(5.0)
+
+    @pytest.mark.asyncio
+    async def test_async_acquire(self, mocker, monotonic):
+        sleep_mock = mocker.patch("deezer.ratelimit.asyncio.sleep")
+        limiter = RateLimiter(max_calls=1, period=5)
+
+        await limiter.async_acquire()
+        sleep_mock.assert_not_called()
+        await limiter.async_acquire()
+        sleep_mock.assert_called_once_with(5.0)
+
+    @pytest.mark.vcr
+    def test_client(self, mocker):
+        limiter = RateLimiter()
+        acquire_spy = mocker.spy(limiter, "acquire")
+        with deezer.Client(
+            headers={"Accept-Encoding": "identity"},
+            rate_limiter=limiter,
+        ) as client:
+            client.get_artist(27)
+        acquire_spy.assert_called_once_with()
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import httpx
+import pytest
+
+import deezer
+from deezer.exceptions import (
+    DeezerErrorResponse,
+    DeezerHTTPError,
+    DeezerNotFoundError,
+    DeezerQuotaExceededError,
+    DeezerRetryableHTTPError,
+)
+from deezer.retry import Retry, parse_retry_after
+
+
+def _http_error(status_code: int, headers: dict | None = None) -> DeezerHTTPError:
+    request = httpx.Request("GET", "https://api.deezer.com/artist/27")
+    response = httpx.Response(status_code=status_code, headers=headers, request=request)
+    http_error = httpx.HTTPStatusError(message="", request=request, response=response)
+    return DeezerHTTPError.from_http_error(http_error)
+
+
+class TestRetry:
+    def test_get_backoff(self):
+        retry = Retry(backoff_factor=0.5, backoff_max=3, jitter=False)
+        assert [retry.get_backoff(attempt) for attempt in range(4)] == [0.5, 1, 2, 3]
+
+    def test_get_backoff_jitter(self, mocker):
+        uniform_mock = mocker.patch("deezer.retry.random.uniform", return_value=0.7)
+        retry = Retry(backoff_factor=0.5)
+        assert retry.get_backoff(2) == 0.7
+        uniform_mock.assert_called_once_with(0, 2.0)
+
+    @pytest.mark.parametrize(
+        ("method", "exc", "expected"),
+        [
+            ("GET", httpx.ConnectError("Connection refused"), True),
+            ("GET", httpx.ReadTimeout("Timed out"), True),
+            ("GET", _http_error(503), True),
+            ("GET", _http_error(404), False),
+            ("GET", DeezerErrorResponse({"error": {"code": 800}}), False),
+            ("GET", DeezerQuotaExceededError({"error": {"code": 4}}), True),
+            ("POST", _http_error(503), False),
+            ("POST", httpx.ReadTimeout("Timed out"), False),
+            ("POST", DeezerQuotaExceededError({"error": {"code": 4}}), True),
+        ],
+    )
+    def test_is_retryable(self, method, exc, expected):
+        assert Retry().is_retryable(method, exc) is expected
+
+    def test_get_delay(self):
+        retry = Retry(total=2, jitter=False)
+        exc = _http_error(502)
+        assert retry.get_delay("GET", exc, 0) == 0.5
+        assert retry.get_delay("GET", exc, 1) == 1
+        assert retry.get_delay("GET", exc, 2) is None
+
+    def test_get_delay_not_retryable(self):
+        assert Retry().get_delay("GET", _http_error(404), 0) is None
+
+    def test_get_delay_retry_after(self):
+        retry = Retry(backoff_max=10)
+        assert retry.get_delay("GET", _http_error(503, {"Retry-After": "3"}), 0) == 3
+        assert retry.get_delay("GET", _http_error(429, {"Retry-After": "120"}), 0) == 10
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("5", 5.0),
+        ("1.5", 1.5),
+        ("-1", 0.0),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+        ("not a date", None),
+    ],
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_date():
+    retry_at = dt.datetime.now(dt.timezone.utc) + dt.timedelta(seconds=30)
+    delay = parse_retry_after(retry_at.strftime("%a, %d %b %Y %H:%M:%S GMT"))
+    assert delay is not None
+    assert 28 <= delay <= 30
+
+
+@pytest.mark.vcr
+class TestClientRetry:
+    @pytest.fixture()
+    def sleep_mock(self, mocker):
+        return mocker.patch("deezer.client.time.sleep")
+
+    @pytest.fixture()
+    def client(self):
+        with deezer.Client(
+            headers={"Accept-Encoding": "identity"},
+            retry=Retry(total=2, jitter=False),
+        ) as client:
+            yield client
+
+    def test_retry_http_error(self, client, sleep_mock):
+        artist = client.get_artist(27)
+        assert artist.name == "Daft Punk"
+        sleep_mock.assert_called_once_with(0.5)
+
+    def test_retry_quota_exceeded(self, client, sleep_mock):
+        artist = client.get_artist(27)
+        assert artist.name == "Daft Punk"
+        assert sleep_mock.call_count == 2
+
+    def test_retry_exhausted(self, client, sleep_mock):
+        with pytest.raises(DeezerRetryableHTTPError):
+            client.get_artist(27)
+        assert sleep_mock.call_count == 2
+
+    def test_no_retry(self, client, sleep_mock):
+        with pytest.raises(DeezerNotFoundError):
+            client.request("GET", "does-not-exists")
+        sleep_mock.assert_not_called()
+
+    def test_no_retry_post(self, client, sleep_mock):
+        with pytest.raises(DeezerRetryableHTTPError):
+            client.request("POST", "user/me/tracks", params={"track_id": 3135556})
+        sleep_mock.assert_not_called()
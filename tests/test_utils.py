@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+import deezer
+from deezer.utils import diff_ids, gen_ids_chunks
+
+
+@pytest.mark.parametrize(
+    ("chunk_size", "max_length", "expected"),
+    [
+        (500, 4000, ["1,22,333,4444"]),
+        (2, 4000, ["1,22", "333,4444"]),
+        (500, 8, ["1,22,333", "4444"]),
+        (500, 3, ["1", "22", "333", "4444"]),
+    ],
+)
+def test_gen_ids_chunks(client, chunk_size, max_length, expected):
+    items = [1, 22, deezer.Track(client, json={"id": 333, "type": "track"}), 4444]
+    assert list(gen_ids_chunks(items, chunk_size=chunk_size, max_length=max_length)) == expected
+
+
+def test_gen_ids_chunks_empty():
+    assert list(gen_ids_chunks([])) == []
+
+
+@pytest.mark.parametrize(
+    ("current_ids", "wanted_ids", "expected"),
+    [
+        ([1, 2, 3], [1, 2, 3], ([], [], False)),
+        ([1, 2, 3], [1, 3], ([2], [], False)),
+        ([1, 2], [1, 2, 3, 4], ([], [3, 4], False)),
+        ([1, 2, 3], [3, 1, 4], ([2], [4], True)),
+        ([1, 2], [3, 1, 2], ([], [3], True)),
+        ([], [1, 2], ([], [1, 2], False)),
+        ([1, 2], [], ([1, 2], [], False)),
+        ([1, 1, 2], [1, 2], ([1], [1], True)),
+        ([1, 2, 2, 3], [1, 2, 3], ([2], [2], True)),
+        ([1, 2, 2], [1], ([2], [], False)),
+    ],
+)
+def test_diff_ids(current_ids, wanted_ids, expected):
+    assert diff_ids(current_ids, wanted_ids) == expected
+
+
+@pytest.mark.parametrize(
+    ("current_ids", "wanted_ids", "expected"),
+    [
+        ([1, 2, 3], [1, 2, 3, 4], ([], [4], False)),
+        ([1, 2, 3, 4], [1, 3, 2, 5], ([4, 2, 3], [3, 2, 5], False)),
+        ([1, 1, 2], [1, 2], ([1, 2], [1, 2], False)),
+    ],
+)
+def test_diff_ids_without_reorder(current_ids, wanted_ids, expected):
+    assert diff_ids(current_ids, wanted_ids, can_reorder=False) == expected